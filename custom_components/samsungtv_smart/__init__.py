@@ -27,21 +27,25 @@ from homeassistant.const import (
     CONF_TOKEN,
     MAJOR_VERSION,
     MINOR_VERSION,
+    SERVICE_RELOAD,
     Platform,
     __version__,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.helpers.reload import async_integration_yaml_config
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.typing import ConfigType
 
-from .api.samsungws import ConnectionFailure, SamsungTVWS
+from .api.samsungws import ConnectionFailure, Ping, SamsungTVWS, async_ping_port
 from .api.smartthings import SmartThingsTV
 from .const import (
     ATTR_DEVICE_MAC,
     ATTR_DEVICE_MODEL,
     ATTR_DEVICE_NAME,
     ATTR_DEVICE_OS,
+    ATTR_DEVICE_TOKEN_AUTH,
     CONF_APP_LIST,
     CONF_CHANNEL_LIST,
     CONF_DEVICE_NAME,
@@ -55,6 +59,7 @@ from .const import (
     CONF_UPDATE_METHOD,
     CONF_WS_NAME,
     DATA_CFG_YAML,
+    DATA_MEDIA_PLAYER,
     DATA_OPTIONS,
     DEFAULT_PORT,
     DEFAULT_SOURCE_LIST,
@@ -67,10 +72,13 @@ from .const import (
     RESULT_ST_DEVICE_NOT_FOUND,
     RESULT_SUCCESS,
     RESULT_WRONG_APIKEY,
+    STORAGE_VERSION,
     WS_PREFIX,
     __min_ha_version__,
 )
 from .logo import CUSTOM_IMAGE_BASE_URL, STATIC_IMAGE_BASE_URL
+from .services import async_setup_services
+from .websocket_api import async_setup_websocket_api
 
 DEVICE_INFO = {
     ATTR_DEVICE_ID: "id",
@@ -78,6 +86,7 @@ DEVICE_INFO = {
     ATTR_DEVICE_NAME: "name",
     ATTR_DEVICE_MODEL: "modelName",
     ATTR_DEVICE_OS: "OS",
+    ATTR_DEVICE_TOKEN_AUTH: "TokenAuthSupport",
 }
 
 SAMSMART_SCHEMA = {
@@ -169,6 +178,11 @@ def token_file_name(hostname: str) -> str:
     return f"{DOMAIN}_{hostname}_token"
 
 
+def apps_storage_key(entry_id: str) -> str:
+    """Return the storage key used to save installed apps of an entry."""
+    return f"{DOMAIN}_{entry_id}_apps"
+
+
 def _remove_token_file(hass, hostname, token_file=None):
     """Try to remove token file."""
     if not token_file:
@@ -289,9 +303,15 @@ async def get_device_info(hostname: str, session: ClientSession) -> dict:
         _LOGGER.warning("Error getting HTTP device info for TV: " + hostname)
         return {}
 
+    if not (result := parse_device_info(info)):
+        _LOGGER.warning("Error getting HTTP device info for TV: " + hostname)
+    return result
+
+
+def parse_device_info(info: dict) -> dict:
+    """Extract device information from rest api response"""
     device = info.get("device")
     if not device:
-        _LOGGER.warning("Error getting HTTP device info for TV: " + hostname)
         return {}
 
     result = {
@@ -314,6 +334,7 @@ class SamsungTVInfo:
         self._ws_port = 0
         self._ws_token = None
         self._ping_port = None
+        self._device_info = {}
 
     @property
     def ws_port(self):
@@ -327,17 +348,54 @@ class SamsungTVInfo:
     def ping_port(self):
         return self._ping_port
 
-    def _try_connect_ws(self):
-        """Try to connect to device using web sockets on port 8001 and 8002"""
-
-        self._ping_port = SamsungTVWS.ping_probe(self._hostname)
-        if self._ping_port is None:
-            _LOGGER.error(
-                "Connection to SamsungTV %s failed. Check that TV is on", self._hostname
-            )
-            return RESULT_NOT_SUCCESSFUL
+    @property
+    def device_info(self):
+        return self._device_info
+
+    async def _async_probe(self, session: ClientSession):
+        """
+        Run all probes used to detect device configuration in parallel
+        and return the list with the web socket port to try.
+        """
+        hostname = self._hostname
+        (
+            ws_port_open,
+            wss_port_open,
+            upnp_port_open,
+            icmp_ping,
+            device_info,
+        ) = await asyncio.gather(
+            async_ping_port(hostname, 8001),
+            async_ping_port(hostname, 8002, use_ssl=True),
+            async_ping_port(hostname, 9197),
+            self._hass.async_add_executor_job(Ping(hostname).ping),
+            get_device_info(hostname, session),
+        )
 
-        for port in (8001, 8002):
+        if upnp_port_open:
+            self._ping_port = 9197
+        elif icmp_ping:
+            self._ping_port = 0
+        self._device_info = device_info
+
+        # only one port is returned, so the authorization is requested on
+        # TV once, TV that require token authorization or with Tizen OS
+        # work on SSL port
+        if wss_port_open and (
+            device_info.get(ATTR_DEVICE_TOKEN_AUTH) == "true"
+            or str(device_info.get(ATTR_DEVICE_OS, "")).lower() == "tizen"
+        ):
+            return [8002]
+        if ws_port_open:
+            return [8001]
+        if wss_port_open:
+            return [8002]
+        return []
+
+    def _try_connect_ws(self, ports):
+        """Try to connect to device using web sockets on specified ports"""
+
+        for port in ports:
 
             try:
                 _LOGGER.info(
@@ -414,7 +472,14 @@ class SamsungTVInfo:
         if session is None:
             return RESULT_NOT_SUCCESSFUL
 
-        result = await self._hass.async_add_executor_job(self._try_connect_ws)
+        ws_ports = await self._async_probe(session)
+        if self._ping_port is None and not ws_ports:
+            _LOGGER.error(
+                "Connection to SamsungTV %s failed. Check that TV is on", self._hostname
+            )
+            return RESULT_NOT_SUCCESSFUL
+
+        result = await self._hass.async_add_executor_job(self._try_connect_ws, ws_ports)
         if result == RESULT_SUCCESS:
             if api_key and st_device_id:
                 result = await self._try_connect_st(api_key, st_device_id, session)
@@ -422,6 +487,55 @@ class SamsungTVInfo:
         return result
 
 
+def _get_yaml_entries_config(hass: HomeAssistant, config: ConfigType) -> dict:
+    """Return the additional yaml configuration for each configured entry."""
+    entries_config = {}
+    if DOMAIN not in config:
+        return entries_config
+
+    entries_list = hass.config_entries.async_entries(DOMAIN)
+    for entry_config in config[DOMAIN]:
+
+        # get ip address
+        ip_address = entry_config[CONF_HOST]
+
+        # check if already configured
+        valid_entries = [
+            entry.entry_id
+            for entry in entries_list
+            if entry.data[CONF_HOST] == ip_address
+        ]
+        if not valid_entries:
+            _LOGGER.warning(
+                "Found yaml configuration for not configured device %s. Please use UI to configure",
+                ip_address,
+            )
+            continue
+
+        data_yaml = {
+            key: value
+            for key, value in entry_config.items()
+            if key in SAMSMART_SCHEMA and value
+        }
+        if data_yaml:
+            entries_config[valid_entries[0]] = data_yaml
+
+    return entries_config
+
+
+async def _async_reload_yaml_config(hass: HomeAssistant) -> None:
+    """Reload yaml configuration and apply it to the loaded entries."""
+    if (config := await async_integration_yaml_config(hass, DOMAIN)) is None:
+        return
+
+    entries_config = _get_yaml_entries_config(hass, config)
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        entry_data = hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {})
+        entry_data[DATA_CFG_YAML] = entries_config.get(entry.entry_id, {})
+        if media_player := entry_data.get(DATA_MEDIA_PLAYER):
+            media_player.async_apply_config(entry.data)
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Samsung TV integration."""
     if not is_valid_ha_version():
@@ -434,35 +548,17 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         _LOGGER.warning(msg)
         return True
 
-    if DOMAIN in config:
-        entries_list = hass.config_entries.async_entries(DOMAIN)
-        for entry_config in config[DOMAIN]:
-
-            # get ip address
-            ip_address = entry_config[CONF_HOST]
-
-            # check if already configured
-            valid_entries = [
-                entry.entry_id
-                for entry in entries_list
-                if entry.data[CONF_HOST] == ip_address
-            ]
-            if not valid_entries:
-                _LOGGER.warning(
-                    "Found yaml configuration for not configured device %s. Please use UI to configure",
-                    ip_address,
-                )
-                continue
+    for entry_id, data_yaml in _get_yaml_entries_config(hass, config).items():
+        hass.data.setdefault(DOMAIN, {})[entry_id] = {DATA_CFG_YAML: data_yaml}
 
-            data_yaml = {
-                key: value
-                for key, value in entry_config.items()
-                if key in SAMSMART_SCHEMA and value
-            }
-            if data_yaml:
-                if DOMAIN not in hass.data:
-                    hass.data[DOMAIN] = {}
-                hass.data[DOMAIN][valid_entries[0]] = {DATA_CFG_YAML: data_yaml}
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+
+    async def async_reload_yaml(_: ServiceCall) -> None:
+        """Reload the lists configured in yaml without reloading the entries."""
+        await _async_reload_yaml_config(hass)
+
+    async_register_admin_service(hass, DOMAIN, SERVICE_RELOAD, async_reload_yaml)
 
     # Register path for local logo
     if local_logo_path := await hass.async_add_executor_job(_register_logo_paths, hass):
@@ -493,7 +589,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {})
     hass.data[DOMAIN][entry.entry_id][DATA_OPTIONS] = entry.options.copy()
 
+    # remote share the media player connection, so it is set up after
     await hass.config_entries.async_forward_entry_setups(entry, [Platform.MEDIA_PLAYER])
+    await hass.config_entries.async_forward_entry_setups(entry, [Platform.REMOTE])
 
     return True
 
@@ -501,7 +599,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(
-        entry, [Platform.MEDIA_PLAYER]
+        entry, [Platform.MEDIA_PLAYER, Platform.REMOTE]
     ):
         hass.data[DOMAIN][entry.entry_id].pop(DATA_OPTIONS)
         if not hass.data[DOMAIN][entry.entry_id]:
@@ -513,6 +611,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Remove a config entry."""
     await hass.async_add_executor_job(_remove_token_file, hass, entry.data[CONF_HOST])
+    await Store(hass, STORAGE_VERSION, apps_storage_key(entry.entry_id)).async_remove()
     if DOMAIN in hass.data:
         hass.data[DOMAIN].pop(entry.entry_id, None)
         if not hass.data[DOMAIN]:
@@ -521,4 +620,15 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
 async def _update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update when config_entry options update."""
-    hass.data[DOMAIN][entry.entry_id][DATA_OPTIONS] = entry.options.copy()
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    old_options = entry_data[DATA_OPTIONS]
+    entry_data[DATA_OPTIONS] = entry.options.copy()
+
+    # options are applied in place, without reloading the entry
+    changed = {
+        key
+        for key in old_options.keys() | entry.options.keys()
+        if old_options.get(key) != entry.options.get(key)
+    }
+    if changed and (media_player := entry_data.get(DATA_MEDIA_PLAYER)):
+        media_player.async_apply_options(changed)
@@ -0,0 +1,198 @@
+"""
+SamsungTV Smart LAN discovery - find Samsung TV on local network
+
+Copyright (C) 2020 Ollo69
+
+    This library is free software; you can redistribute it and/or
+    modify it under the terms of the GNU Lesser General Public
+    License as published by the Free Software Foundation; either
+    version 2.1 of the License, or (at your option) any later version.
+
+    This library is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+    Lesser General Public License for more details.
+
+    You should have received a copy of the GNU Lesser General Public
+    License along with this library; if not, write to the Free Software
+    Foundation, Inc., 51 Franklin Street, Fifth Floor,
+    Boston, MA  02110-1335  USA
+
+"""
+import asyncio
+import ipaddress
+import logging
+import socket
+from typing import Dict, Iterable, Optional, Set
+
+from aiohttp import ClientSession
+
+from .rest import DEFAULT_PORT as REST_PORT, SamsungTVAsyncRest
+from .samsungws import async_ping_port
+
+SSDP_ADDR = "239.255.255.250"
+SSDP_PORT = 1900
+SSDP_ST = "urn:samsung.com:device:RemoteControlReceiver:1"
+
+DISCOVERY_TIMEOUT = 3
+PROBE_TIMEOUT = 1
+MAX_CONCURRENT_PROBES = 64
+MAX_SCAN_HOSTS = 1024
+WS_PORTS = (8001, 8002)
+
+_LOGGING = logging.getLogger(__name__)
+
+
+def get_local_network(prefix: int = 24) -> Optional[str]:
+    """Return the local network in CIDR notation, None if not detected."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        try:
+            # no packet is sent, used only to select the outgoing interface
+            s.connect(("10.255.255.255", 1))
+            local_ip = s.getsockname()[0]
+        except OSError:
+            return None
+    return str(ipaddress.ip_network(f"{local_ip}/{prefix}", strict=False))
+
+
+def get_network_hosts(network: str) -> list:
+    """
+    Return the list of hosts in a network in CIDR notation.
+    Raise ValueError if network is not valid or too large.
+    """
+    net = ipaddress.ip_network(network, strict=False)
+    if net.num_addresses > MAX_SCAN_HOSTS:
+        raise ValueError(f"Network {network} too large, max {MAX_SCAN_HOSTS} hosts")
+    return [str(host) for host in net.hosts()] or [str(net.network_address)]
+
+
+class _SSDPProtocol(asyncio.DatagramProtocol):
+    """Collect address of devices that reply to M-SEARCH request."""
+
+    def __init__(self):
+        self.hosts: Set[str] = set()
+
+    def datagram_received(self, data, addr):
+        if data.startswith(b"HTTP/1.1 200"):
+            self.hosts.add(addr[0])
+
+
+async def async_ssdp_search(
+    *,
+    timeout=DISCOVERY_TIMEOUT,
+    ssdp_addr=SSDP_ADDR,
+    ssdp_port=SSDP_PORT,
+    search_target=SSDP_ST,
+) -> Set[str]:
+    """Send SSDP M-SEARCH request and return the hosts that replied."""
+    request = "\r\n".join(
+        [
+            "M-SEARCH * HTTP/1.1",
+            f"HOST: {ssdp_addr}:{ssdp_port}",
+            'MAN: "ssdp:discover"',
+            f"MX: {max(1, int(timeout) - 1)}",
+            f"ST: {search_target}",
+            "",
+            "",
+        ]
+    ).encode()
+
+    loop = asyncio.get_running_loop()
+    try:
+        transport, protocol = await loop.create_datagram_endpoint(
+            _SSDPProtocol, family=socket.AF_INET
+        )
+    except OSError as exc:
+        _LOGGING.warning("Failed to start SSDP discovery: %s", exc)
+        return set()
+
+    try:
+        transport.sendto(request, (ssdp_addr, ssdp_port))
+        await asyncio.sleep(timeout)
+    except OSError as exc:
+        _LOGGING.warning("Failed to send SSDP discovery request: %s", exc)
+    finally:
+        transport.close()
+
+    return protocol.hosts
+
+
+async def async_scan_hosts(
+    hosts: Iterable[str],
+    ports: Iterable[int] = WS_PORTS,
+    *,
+    timeout=PROBE_TIMEOUT,
+    max_concurrent=MAX_CONCURRENT_PROBES,
+) -> Set[str]:
+    """Return the hosts that have at least one of the specified ports open."""
+    limit = asyncio.Semaphore(max_concurrent)
+    ports = list(ports)
+
+    async def _probe(host):
+        async with limit:
+            for port in ports:
+                if await async_ping_port(host, port, timeout=timeout):
+                    return host
+        return None
+
+    results = await asyncio.gather(*[_probe(host) for host in hosts])
+    return {host for host in results if host}
+
+
+async def async_discover_tvs(
+    network: Optional[str] = None,
+    session: Optional[ClientSession] = None,
+    *,
+    exclude: Iterable[str] = (),
+    timeout=DISCOVERY_TIMEOUT,
+    ssdp_addr=SSDP_ADDR,
+    ssdp_port=SSDP_PORT,
+    scan_ports: Iterable[int] = WS_PORTS,
+    probe_timeout=PROBE_TIMEOUT,
+    rest_port=REST_PORT,
+) -> Dict[str, dict]:
+    """
+    Discover Samsung TV on local network using SSDP and, if a network
+    in CIDR notation is specified, scanning web socket ports on all hosts.
+    Return a dict with host as key and the device info as value.
+    Raise ValueError if network is not valid or too large.
+    """
+    exclude = set(exclude)
+    scan_hosts = [
+        host
+        for host in (get_network_hosts(network) if network else [])
+        if host not in exclude
+    ]
+
+    ssdp_hosts, scan_found = await asyncio.gather(
+        async_ssdp_search(timeout=timeout, ssdp_addr=ssdp_addr, ssdp_port=ssdp_port),
+        async_scan_hosts(scan_hosts, scan_ports, timeout=probe_timeout),
+    )
+    found_hosts = sorted((ssdp_hosts | scan_found) - exclude)
+    _LOGGING.debug("Hosts found during discovery: %s", found_hosts)
+    if not found_hosts:
+        return {}
+
+    managed_session = session is None
+    if managed_session:
+        session = ClientSession()
+    try:
+        infos = await asyncio.gather(
+            *[
+                SamsungTVAsyncRest(host, session, port=rest_port).async_device_info()
+                for host in found_hosts
+            ]
+        )
+    finally:
+        if managed_session:
+            await session.close()
+
+    result = {}
+    for host, info in zip(found_hosts, infos):
+        if not info or not (device := info.get("device")):
+            continue
+        if "tv" not in device.get("type", "").lower():
+            continue
+        result[host] = info
+
+    return result
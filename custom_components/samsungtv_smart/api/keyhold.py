@@ -0,0 +1,105 @@
+"""
+SamsungTV Smart key hold - long press of keys without blocking threads
+
+Copyright (C) 2020 Ollo69
+
+    This library is free software; you can redistribute it and/or
+    modify it under the terms of the GNU Lesser General Public
+    License as published by the Free Software Foundation; either
+    version 2.1 of the License, or (at your option) any later version.
+
+    This library is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+    Lesser General Public License for more details.
+
+    You should have received a copy of the GNU Lesser General Public
+    License along with this library; if not, write to the Free Software
+    Foundation, Inc., 51 Franklin Street, Fifth Floor,
+    Boston, MA  02110-1335  USA
+
+"""
+import asyncio
+import logging
+from typing import Dict, List, Set, Tuple
+
+from .samsungws import SamsungTVWS
+
+_LOGGING = logging.getLogger(__name__)
+
+
+class KeyHoldManager:
+    """
+    Manage long press of keys with a scheduled release.
+    Press is sent immediately and release is scheduled with a timer, so
+    no thread is blocked while the key is held and holds of different keys
+    can overlap. Keys still pressed can be released all together when the
+    connection is lost or on shutdown, release is not sent when the
+    connection is already closed because the TV drop the keys by itself.
+    """
+
+    def __init__(self, ws: SamsungTVWS):
+        """Initialize KeyHoldManager object."""
+        self._ws = ws
+        self._holds: Dict[str, Tuple[asyncio.TimerHandle, asyncio.Future]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def pressed_keys(self) -> List[str]:
+        """Return the keys currently held."""
+        return list(self._holds)
+
+    async def _async_send(self, key: str, cmd: str) -> bool:
+        """Send press or release command for a key."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(None, self._ws.send_key, key, 0, cmd)
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOGGING.debug("Failed sending %s for key %s: %s", cmd, key, exc)
+            return False
+
+    async def async_hold(self, key: str, seconds: float) -> bool:
+        """
+        Press a key and release it after the specified time.
+        Return when the key is released, True if press and release were sent.
+        """
+        if key in self._holds:
+            await self.async_release(key)
+
+        if not await self._async_send(key, "Press"):
+            return False
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        handle = loop.call_later(seconds, self._schedule_release, key)
+        self._holds[key] = (handle, future)
+        return await asyncio.shield(future)
+
+    def _schedule_release(self, key: str) -> None:
+        """Start the task that release a key, called by the hold timer."""
+        task = asyncio.get_running_loop().create_task(self.async_release(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def async_release(self, key: str) -> bool:
+        """Release a key held, return False if key was not held."""
+        if (hold := self._holds.pop(key, None)) is None:
+            return False
+        handle, future = hold
+        handle.cancel()
+        if self._ws.is_connected:
+            result = await self._async_send(key, "Release")
+        else:
+            # sending would try to reconnect and block until connection timeout
+            _LOGGING.debug("Connection closed, release not sent for key %s", key)
+            result = False
+        if not future.done():
+            future.set_result(result)
+        return result
+
+    async def async_release_all(self) -> None:
+        """Release all keys held."""
+        if not self._holds:
+            return
+        _LOGGING.debug("Releasing held keys: %s", self.pressed_keys)
+        await asyncio.gather(*[self.async_release(key) for key in self.pressed_keys])
@@ -0,0 +1,123 @@
+"""
+SamsungTV Smart pointer - stream pointer movements to the TV
+
+Copyright (C) 2020 Ollo69
+
+    This library is free software; you can redistribute it and/or
+    modify it under the terms of the GNU Lesser General Public
+    License as published by the Free Software Foundation; either
+    version 2.1 of the License, or (at your option) any later version.
+
+    This library is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+    Lesser General Public License for more details.
+
+    You should have received a copy of the GNU Lesser General Public
+    License along with this library; if not, write to the Free Software
+    Foundation, Inc., 51 Franklin Street, Fifth Floor,
+    Boston, MA  02110-1335  USA
+
+"""
+import asyncio
+import logging
+from typing import Optional
+
+from .samsungws import SamsungTVWS
+
+FRAME_RATE = 30
+IDLE_TIMEOUT = 2
+
+_LOGGING = logging.getLogger(__name__)
+
+
+class PointerSession:
+    """
+    Stream pointer movements to the TV at a capped frame rate.
+    Movements received between two frames are merged in a single move,
+    and clicks are sent in the same frame after the move. Only one frame
+    at a time is in flight, so when the TV is slow intermediate positions
+    are merged instead of queued. The session is closed when idle and
+    reopened on next movement.
+    """
+
+    def __init__(
+        self, ws: SamsungTVWS, frame_rate=FRAME_RATE, idle_timeout=IDLE_TIMEOUT
+    ):
+        """Initialize PointerSession object."""
+        self._ws = ws
+        self._interval = 1 / frame_rate
+        self._idle_timeout = idle_timeout
+        self._dx = 0
+        self._dy = 0
+        self._clicks = 0
+        self._closing = False
+        self._event: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return True if the session is open."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def _has_pending(self) -> bool:
+        """Return True if there are movements or clicks to send."""
+        return bool(self._dx or self._dy or self._clicks)
+
+    def open(self) -> None:
+        """Open the session, must be called from the event loop."""
+        if self.is_open:
+            return
+        self._closing = False
+        self._event = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._async_run())
+
+    def move(self, dx: int, dy: int) -> None:
+        """Add a relative movement to the next frame."""
+        self._dx += dx
+        self._dy += dy
+        self.open()
+        self._event.set()
+
+    def click(self) -> None:
+        """Add a click to the next frame."""
+        self._clicks += 1
+        self.open()
+        self._event.set()
+
+    async def async_close(self) -> None:
+        """Send pending movements and close the session."""
+        if not self.is_open:
+            return
+        self._closing = True
+        self._event.set()
+        await self._task
+
+    def _send_frame(self, dx: int, dy: int, clicks: int) -> bool:
+        """Send a frame, executed in executor."""
+        return self._ws.send_pointer_frame(dx, dy, clicks)
+
+    async def _async_run(self) -> None:
+        """Send a frame for each interval with movements."""
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._closing:
+                try:
+                    await asyncio.wait_for(self._event.wait(), self._idle_timeout)
+                except asyncio.TimeoutError:
+                    return
+            self._event.clear()
+
+            start = loop.time()
+            if self._has_pending:
+                dx, dy, clicks = self._dx, self._dy, self._clicks
+                self._dx = self._dy = self._clicks = 0
+                try:
+                    await loop.run_in_executor(None, self._send_frame, dx, dy, clicks)
+                except Exception as exc:  # pylint: disable=broad-except
+                    _LOGGING.debug("Failed sending pointer frame: %s", exc)
+
+            if self._closing and not self._has_pending:
+                return
+            await asyncio.sleep(max(self._interval - (loop.time() - start), 0))
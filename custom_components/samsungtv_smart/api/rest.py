@@ -0,0 +1,203 @@
+"""
+SamsungTVAsyncRest - Samsung Smart TV async rest API wrapper
+
+Copyright (C) 2020 Ollo69
+
+    This library is free software; you can redistribute it and/or
+    modify it under the terms of the GNU Lesser General Public
+    License as published by the Free Software Foundation; either
+    version 2.1 of the License, or (at your option) any later version.
+
+    This library is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+    Lesser General Public License for more details.
+
+    You should have received a copy of the GNU Lesser General Public
+    License along with this library; if not, write to the Free Software
+    Foundation, Inc., 51 Franklin Street, Fifth Floor,
+    Boston, MA  02110-1335  USA
+
+"""
+import asyncio
+from enum import Enum
+import json
+import logging
+from typing import Dict, Iterable, Optional
+
+from aiohttp import ClientConnectionError, ClientResponseError, ClientSession
+import async_timeout
+
+DEFAULT_PORT = 8001
+DEFAULT_TIMEOUT = 2
+MAX_HOST_CONNECTIONS = 4
+
+_LOGGING = logging.getLogger(__name__)
+
+
+def _format_rest_url(host: str, append: str = "", port=DEFAULT_PORT) -> str:
+    """Return URL used for rest commands."""
+    return f"http://{host}:{port}/api/v2/{append}"
+
+
+class PowerState(Enum):
+    """Define possible power state reported by rest api."""
+
+    Unknown = 0
+    Off = 1
+    Standby = 2
+    On = 3
+
+
+class SamsungTVAsyncRest:
+    """Class to manage rest api communication with tizen TV."""
+
+    def __init__(
+        self,
+        host,
+        session: Optional[ClientSession] = None,
+        timeout=DEFAULT_TIMEOUT,
+        port=DEFAULT_PORT,
+    ):
+        """Initialize SamsungTVAsyncRest object."""
+        self._host = host
+        self._port = port
+        self._timeout = timeout or DEFAULT_TIMEOUT
+        # if not provided, session is created on first request
+        self._session = session
+        self._managed_session = session is None
+        # limit the concurrent connections opened with the TV,
+        # created on first request because it require a running loop
+        self._host_limit: Optional[asyncio.Semaphore] = None
+
+        # None means not yet detected
+        self._power_state_supported: Optional[bool] = None
+        self._frame_tv_support = False
+
+    @property
+    def power_state_supported(self) -> bool:
+        """Return True if TV report power state using rest api."""
+        return self._power_state_supported is True
+
+    @property
+    def frame_tv_support(self) -> bool:
+        """Return True if TV report support for art mode (Frame TV)."""
+        return self._frame_tv_support
+
+    async def async_disconnect(self):
+        """Close the session if managed by this object."""
+        if self._managed_session and self._session:
+            await self._session.close()
+            self._session = None
+
+    async def _rest_request(self, target="", method="GET", *, timeout=None):
+        """Execute a rest request and return the response text."""
+        if self._session is None:
+            self._session = ClientSession()
+        if self._host_limit is None:
+            self._host_limit = asyncio.Semaphore(MAX_HOST_CONNECTIONS)
+
+        url = _format_rest_url(self._host, target, self._port)
+        async with self._host_limit:
+            # the deadline include the time spent waiting for a connection
+            async with async_timeout.timeout(timeout or self._timeout):
+                async with self._session.request(
+                    method, url, raise_for_status=True
+                ) as resp:
+                    return await resp.text()
+
+    async def _rest_json_request(
+        self, target="", method="GET", *, timeout=None
+    ) -> Optional[dict]:
+        """Execute a rest request, return parsed response or None if failed."""
+        try:
+            response = await self._rest_request(target, method, timeout=timeout)
+        except (asyncio.TimeoutError, ClientConnectionError, ClientResponseError):
+            _LOGGING.debug("Rest request %s %s to TV failed", method, target)
+            return None
+
+        try:
+            return json.loads(response)
+        except json.JSONDecodeError:
+            _LOGGING.debug(
+                "Failed to parse response from TV. response text: %s", response
+            )
+        return {}
+
+    async def async_device_info(self, *, timeout=None) -> Optional[dict]:
+        """Get device info, return None if TV unreachable."""
+        _LOGGING.debug("Get device info via rest api")
+        return await self._rest_json_request(timeout=timeout)
+
+    async def async_app_status(self, app_id, *, timeout=None) -> Optional[dict]:
+        """Get app status, return None if TV unreachable."""
+        _LOGGING.debug("Get app %s status via rest api", app_id)
+        return await self._rest_json_request("applications/" + app_id, timeout=timeout)
+
+    async def async_app_status_many(
+        self, app_ids: Iterable[str], *, timeout=None
+    ) -> Dict[str, Optional[dict]]:
+        """
+        Get status for multiple apps.
+        Requests are executed concurrently, limited by the max number of
+        connections allowed with the TV.
+        """
+        app_ids = list(dict.fromkeys(app_ids))
+        results = await asyncio.gather(
+            *[self.async_app_status(app_id, timeout=timeout) for app_id in app_ids]
+        )
+        return dict(zip(app_ids, results))
+
+    async def async_app_run(self, app_id, *, timeout=None) -> Optional[dict]:
+        """Run an app, return None if TV unreachable."""
+        _LOGGING.debug("Run app %s via rest api", app_id)
+        return await self._rest_json_request(
+            "applications/" + app_id, "POST", timeout=timeout
+        )
+
+    async def async_app_close(self, app_id, *, timeout=None) -> Optional[dict]:
+        """Close an app, return None if TV unreachable."""
+        _LOGGING.debug("Close app %s via rest api", app_id)
+        return await self._rest_json_request(
+            "applications/" + app_id, "DELETE", timeout=timeout
+        )
+
+    async def async_app_install(self, app_id, *, timeout=None) -> Optional[dict]:
+        """Install an app, return None if TV unreachable."""
+        _LOGGING.debug("Install app %s via rest api", app_id)
+        return await self._rest_json_request(
+            "applications/" + app_id, "PUT", timeout=timeout
+        )
+
+    async def async_power_state(self) -> PowerState:
+        """
+        Get the TV power state using rest api.
+        Return PowerState.Unknown if the feature is not supported by TV
+        or support is not detected yet.
+        """
+        if self._power_state_supported is False:
+            return PowerState.Unknown
+
+        if (info := await self.async_device_info()) is None:
+            if self._power_state_supported:
+                return PowerState.Off
+            return PowerState.Unknown
+
+        if not (device := info.get("device")):
+            return PowerState.Unknown
+
+        # Frame TV report standby power state also when in art mode
+        self._frame_tv_support = str(device.get("FrameTVSupport")).lower() == "true"
+
+        if (power_state := device.get("PowerState")) is None:
+            _LOGGING.debug("TV %s do not support rest power state", self._host)
+            self._power_state_supported = False
+            return PowerState.Unknown
+
+        if self._power_state_supported is None:
+            _LOGGING.debug("TV %s support rest power state", self._host)
+            self._power_state_supported = True
+
+        if power_state.lower() == "on":
+            return PowerState.On
+        return PowerState.Standby
@@ -20,30 +20,49 @@ Copyright (C) 2020 Ollo69
     Boston, MA  02110-1335  USA
 
 """
+import asyncio
 import base64
+from concurrent.futures import CancelledError
 from datetime import datetime
 from enum import Enum
+from functools import partial
+import hashlib
 import json
 import logging
+import random
 import socket
 import ssl
 import subprocess
 import sys
 from threading import Lock, Thread
 import time
-from typing import Any
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlencode, urljoin
 import uuid
 
-import requests
 import websocket
 
 from . import shortcuts
-
+from .rest import SamsungTVAsyncRest
+from .sendqueue import SendPriority, SendQueue
+
+APP_LAUNCH_CONTROL = "control"
+APP_LAUNCH_REMOTE = "remote"
+APP_LAUNCH_REST = "rest"
+APP_LAUNCH_METHODS = [APP_LAUNCH_CONTROL, APP_LAUNCH_REMOTE, APP_LAUNCH_REST]
+APP_LAUNCH_TIMEOUT = 6
+APP_STATUS_INTERVAL = 0.5
+BACKOFF_BASE_DELAY = 1
+BACKOFF_JITTER = 0.2
+BACKOFF_MAX_DELAY = 120
 DEFAULT_POWER_ON_DELAY = 120
+EVENT_APP_CHANGED = "app_changed"
+EVENT_TV_UPDATE = "tv_update"
+KEY_REPEAT_DELAY = 0.1
 MIN_APP_SCAN_INTERVAL = 10
 MAX_WS_PING_INTERVAL = 10
 PING_TIMEOUT = 3
+SHUTDOWN_TIMEOUT = 5
 TYPE_DEEP_LINK = "DEEP_LINK"
 TYPE_NATIVE_LAUNCH = "NATIVE_LAUNCH"
 
@@ -52,6 +71,10 @@ _WS_ENDPOINT_APP_CONTROL = "/api/v2"
 _WS_ENDPOINT_ART = "/api/v2/channels/com.samsung.art-app"
 _WS_LOG_NAME = "websocket"
 
+_CHANNEL_ART = "art"
+_CHANNEL_CONTROL = "control"
+_CHANNEL_REMOTE = "remote"
+
 _LOGGING = logging.getLogger(__name__)
 
 
@@ -62,11 +85,6 @@ def _set_ws_logger_level(level: int = logging.CRITICAL) -> None:
         ws_logger.setLevel(level)
 
 
-def _format_rest_url(host: str, append: str = "") -> str:
-    """Return URL used for rest commands."""
-    return f"http://{host}:8001/api/v2/{append}"
-
-
 def gen_uuid() -> str:
     """Generate new uuid."""
     return str(uuid.uuid4())
@@ -121,6 +139,57 @@ class Ping:
             return s.connect_ex((self._ip_address, port)) == 0
 
 
+async def async_ping_port(host, port, *, use_ssl=False, timeout=PING_TIMEOUT - 1):
+    """Check if port is available and return True if success.
+    If use_ssl is True, success require a completed TLS handshake.
+    """
+    ssl_context = None
+    if use_ssl:
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=ssl_context), timeout
+        )
+    except (asyncio.TimeoutError, OSError):
+        return False
+
+    writer.close()
+    return True
+
+
+class LaunchStats:
+    """Statistics of an app launch method."""
+
+    # weight of last measure in average latency
+    LATENCY_WEIGHT = 0.3
+
+    def __init__(self):
+        self.success = 0
+        self.failure = 0
+        self.avg_latency = None
+
+    def add_result(self, latency: Optional[float]):
+        """Add a launch result, latency is None if launch failed."""
+        if latency is None:
+            self.failure += 1
+            return
+        self.success += 1
+        if self.avg_latency is None:
+            self.avg_latency = latency
+        else:
+            self.avg_latency += (latency - self.avg_latency) * self.LATENCY_WEIGHT
+
+    def as_dict(self):
+        return {
+            "success": self.success,
+            "failure": self.failure,
+            "avg_latency": self.avg_latency,
+        }
+
+
 class ConnectionFailure(Exception):
     """Error during connection."""
 
@@ -133,12 +202,6 @@ class ResponseError(Exception):
     pass
 
 
-class HttpApiError(Exception):
-    """Error using HTTP API."""
-
-    pass
-
-
 class App:
     """Define a TV Application."""
 
@@ -148,6 +211,13 @@ class App:
         self.app_type = app_type
 
 
+class ConnectionState(Enum):
+    Disconnected = 0
+    Connecting = 1
+    Connected = 2
+    Backoff = 3
+
+
 class ArtModeStatus(Enum):
     """Define possible ArtMode status."""
 
@@ -170,14 +240,18 @@ class SamsungTVWS:
         key_press_delay=1.0,
         name="SamsungTvRemote",
         app_list=None,
+        session=None,
     ):
         """Initialize SamsungTVWS object."""
         self.host = host
         self.token = token
         self.token_file = token_file
+        self._token_loaded = False
+        self._token_lock = Lock()
         self.port = port or 8001
         self.timeout = None if timeout == 0 else timeout
         self.key_press_delay = key_press_delay
+        self.key_repeat_delay = KEY_REPEAT_DELAY
         self.name = name or "SamsungTvRemote"
         self.connection = None
         self._app_list = app_list
@@ -188,12 +262,32 @@ class SamsungTVWS:
         self._power_on_artmode = False
 
         self._installed_app = {}
+        self._installed_app_hash = None
+        self._app_to_check = None
+        self._app_lock = Lock()
         self._running_app = None
         self._app_type = {}
         self._sync_lock = Lock()
+        self._app_waiters: List[tuple] = []
+        self._app_waiters_lock = Lock()
+        self._launch_stats: Dict[str, Dict[str, LaunchStats]] = {}
         self._last_app_scan = datetime.min
         self._is_connected = False
 
+        self._conn_lock = Lock()
+        self._is_shutdown = False
+        self._conn_state = ConnectionState.Disconnected
+        self._conn_failures = 0
+        self._conn_reconnects = 0
+        self._conn_has_connected = False
+        self._backoff_until = 0.0
+
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._tls_session: Optional[ssl.SSLSession] = None
+        self._tls_handshakes = 0
+        self._tls_resumed = 0
+        self._tls_handshake_time = 0.0
+
         self._ws_remote = None
         self._client_remote = None
         self._last_ping = datetime.min
@@ -207,8 +301,17 @@ class SamsungTVWS:
         self._last_art_ping = datetime.min
         self._client_art_supported = 2
 
+        self._send_queues = {
+            channel: SendQueue(f"SamsungSend{channel.capitalize()}")
+            for channel in (_CHANNEL_REMOTE, _CHANNEL_CONTROL, _CHANNEL_ART)
+        }
+
         self._ping = Ping(self.host)
         self._new_token_callback = None
+        self._installed_app_callback = None
+        self._status_callback = None
+        self._event_callback = None
+        self._rest_api = SamsungTVAsyncRest(self.host, session=session)
 
     def __enter__(self):
         return self
@@ -254,35 +357,119 @@ class SamsungTVWS:
         """Register a callback function."""
         self._new_token_callback = func
 
+    def register_installed_app_callback(self, func):
+        """Register a callback function called when installed apps change."""
+        self._installed_app_callback = func
+
+    def register_status_callback(self, func):
+        """Register a callback function called when connection status change."""
+        self._status_callback = func
+
+    def _notify_status(self, connected: bool):
+        """Notify the connection status change."""
+        if self._status_callback is not None:
+            self._status_callback(connected)
+
+    def register_event_callback(self, func):
+        """Register a callback function called when TV notify a state change."""
+        self._event_callback = func
+
+    def _notify_event(self, event: str, data=None):
+        """Notify a TV state change event."""
+        if self._event_callback is not None:
+            self._event_callback(event, data)
+
     def _get_token(self):
-        """Get current token."""
-        if self.token_file is not None:
+        """Get current token, the token file is read only the first time."""
+        if self.token_file is not None and not self._token_loaded:
+            self._token_loaded = True
             try:
                 with open(self.token_file, "r") as token_file:
-                    return token_file.readline()
+                    self.token = token_file.readline().strip() or self.token
+            except FileNotFoundError:
+                pass
             except Exception as exc:
                 _LOGGING.error("Failed to read TV token file: %s", str(exc))
-                return ""
         return self.token
 
     def _set_token(self, token):
-        """Save new token."""
+        """Save new token, persisted only if changed."""
+        if token == self._get_token():
+            return
         _LOGGING.debug("New token %s", token)
+        self.token = token
         if self.token_file is not None:
-            _LOGGING.debug("Save new token to file %s", self.token_file)
-            with open(self.token_file, "w") as token_file:
-                token_file.write(token)
+            # file is written in background to not delay the connection
+            Thread(
+                target=self._save_token_file, name="SamsungToken", daemon=True
+            ).start()
             return
 
-        if self.token is not None and self.token == token:
-            return
-        self.token = token
         if self._new_token_callback is not None:
             self._new_token_callback()
 
+    def _save_token_file(self):
+        """Write the current token to the token file."""
+        with self._token_lock:
+            _LOGGING.debug("Save new token to file %s", self.token_file)
+            try:
+                with open(self.token_file, "w") as token_file:
+                    token_file.write(self.token)
+            except OSError as exc:
+                _LOGGING.error("Failed to write TV token file: %s", str(exc))
+
     def _ws_send(
+        self,
+        command,
+        key_press_delay=None,
+        *,
+        use_control=False,
+        ws_socket=None,
+        priority=SendPriority.User,
+        wait=True,
+    ):
+        """
+        Queue a command on the outbound queue of the target connection.
+        User commands cancel queued background commands on all connections.
+        Background commands, or if wait is False, are not waited and
+        return True when queued.
+        """
+        if use_control and not ws_socket:
+            self.start_client(start_all=True)
+            return False
+
+        if not use_control:
+            channel = _CHANNEL_REMOTE
+        elif ws_socket is self._ws_art:
+            channel = _CHANNEL_ART
+        else:
+            channel = _CHANNEL_CONTROL
+        send_queue = self._send_queues[channel]
+
+        def send_command():
+            return self._ws_send_now(
+                command, key_press_delay, use_control=use_control, ws_socket=ws_socket
+            )
+
+        if send_queue.is_worker_thread():
+            return send_command()
+
+        if priority == SendPriority.User:
+            for queue in self._send_queues.values():
+                queue.cancel_pending(SendPriority.Background)
+
+        future = send_queue.submit(send_command, priority)
+        if priority == SendPriority.Background or not wait:
+            return True
+        try:
+            return future.result()
+        except CancelledError:
+            return False
+
+    def _ws_send_now(
         self, command, key_press_delay=None, *, use_control=False, ws_socket=None
     ):
+        """Send a command on the websocket connection."""
         using_remote = False
         if not use_control:
             if self._ws_remote:
@@ -290,11 +477,8 @@ class SamsungTVWS:
                 using_remote = True
             else:
                 connection = self.open()
-        elif ws_socket:
-            connection = ws_socket
         else:
-            self.start_client(start_all=True)
-            return False
+            connection = ws_socket
 
         payload = json.dumps(command)
         try:
@@ -321,20 +505,6 @@ class SamsungTVWS:
 
         return True
 
-    def _rest_request(self, target, method="GET"):
-        url = _format_rest_url(self.host, target)
-        try:
-            if method == "POST":
-                return requests.post(url, timeout=self.timeout)
-            elif method == "PUT":
-                return requests.put(url, timeout=self.timeout)
-            elif method == "DELETE":
-                return requests.delete(url, timeout=self.timeout)
-            else:
-                return requests.get(url, timeout=self.timeout)
-        except requests.ConnectionError:
-            raise HttpApiError("TV unreachable or feature not supported on this model.")
-
     @staticmethod
     def _process_api_response(response, *, raise_error=True):
         try:
@@ -368,39 +538,206 @@ class SamsungTVWS:
         return False
 
     @staticmethod
-    def _run_forever(
-        ws_app: websocket.WebSocketApp, *, sslopt: dict = None, ping_interval: int = 0
-    ) -> None:
+    def _run_forever(ws_app: websocket.WebSocketApp, *, ping_interval: int = 0) -> None:
         """Call method run_forever changing library log level before."""
         _set_ws_logger_level()
-        ws_app.run_forever(sslopt=sslopt, ping_interval=ping_interval)
+        try:
+            ws_app.run_forever(ping_interval=ping_interval)
+        finally:
+            # when closed by another thread run_forever can return without
+            # stopping the ping thread, that would never terminate
+            if stop_ping := getattr(ws_app, "stop_ping", None):
+                stop_ping.set()
+
+    @staticmethod
+    def _close_ws_app(ws_app: websocket.WebSocketApp) -> None:
+        """
+        Stop a websocket app running in another thread.
+        Socket is only shut down to wake up the thread waiting for data, that
+        then close it. Closing the socket here can leave the thread waiting on
+        a closed descriptor until the select timeout expire.
+        """
+        ws_app.keep_running = False
+        try:
+            if sock := ws_app.sock:
+                sock.abort()
+        except (AttributeError, OSError):
+            pass
+
+    def _create_socket(self, is_ssl=False):
+        """
+        Return a socket connected to the TV, used by websocket connections
+        to have a timeout specific for the TV instead of the global one.
+        """
+        if not is_ssl:
+            return self._open_tcp_socket()
+
+        try:
+            return self._open_ssl_socket(self._tls_session)
+        except ssl.SSLError:
+            if self._tls_session is None:
+                raise
+            # session refused by TV, retry with a full handshake
+            _LOGGING.debug("TLS session resumption failed, using full handshake")
+            self._tls_session = None
+            return self._open_ssl_socket(None)
+
+    def _open_tcp_socket(self):
+        """Return a TCP socket connected to the TV."""
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def _get_ssl_context(self):
+        """Return the SSL context, shared by all the connections to the TV."""
+        if self._ssl_context is None:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            self._ssl_context = context
+        return self._ssl_context
+
+    def _open_ssl_socket(self, session):
+        """
+        Return a TLS socket connected to the TV resuming the session if
+        specified, so connections to different channels and reconnects
+        avoid a full handshake when the TV support session resumption.
+        """
+        sock = self._open_tcp_socket()
+        start_time = time.monotonic()
+        try:
+            ssl_sock = self._get_ssl_context().wrap_socket(
+                sock, server_hostname=self.host, session=session
+            )
+        except Exception:
+            sock.close()
+            raise
+
+        handshake_time = time.monotonic() - start_time
+        self._tls_handshakes += 1
+        self._tls_handshake_time += handshake_time
+        if ssl_sock.session_reused:
+            self._tls_resumed += 1
+        _LOGGING.debug(
+            "TLS handshake with %s in %.3fs, session reused: %s",
+            self.host,
+            handshake_time,
+            ssl_sock.session_reused,
+        )
+        self._save_tls_session(ssl_sock)
+        return ssl_sock
+
+    def _save_tls_session(self, sock):
+        """Save the TLS session of a socket, to resume it on next connection."""
+        if not isinstance(sock, ssl.SSLSocket):
+            return
+        try:
+            if session := sock.session:
+                self._tls_session = session
+        except (OSError, ValueError):
+            pass
+
+    def get_tls_stats(self):
+        """Return the statistics of the TLS handshakes."""
+        return {
+            "handshakes": self._tls_handshakes,
+            "resumed": self._tls_resumed,
+            "avg_handshake_time": round(
+                self._tls_handshake_time / self._tls_handshakes, 3
+            )
+            if self._tls_handshakes
+            else None,
+        }
+
+    def _create_ws_app(self, endpoint, is_ssl, use_token=True, **kwargs):
+        """Return a websocket app using a prepared socket, None if TV not reachable."""
+        url = self._format_websocket_url(endpoint, is_ssl=is_ssl, use_token=use_token)
+        try:
+            sock = self._create_socket(is_ssl)
+        except OSError as exc:
+            _LOGGING.debug("Failed to connect to %s: %s", url, exc)
+            return None
+        if self._is_shutdown:
+            sock.close()
+            return None
+        return websocket.WebSocketApp(url, socket=sock, **kwargs)
+
+    @property
+    def connection_state(self):
+        return self._conn_state
+
+    def get_connection_stats(self):
+        """Return the statistics of the remote connection."""
+        return {
+            "state": self._conn_state.name,
+            "failures": self._conn_failures,
+            "reconnects": self._conn_reconnects,
+            "backoff": max(round(self._backoff_until - time.monotonic(), 1), 0),
+            "tls": self.get_tls_stats(),
+        }
+
+    def _set_connection_open(self):
+        """Update connection state when remote connection is established."""
+        with self._conn_lock:
+            if self._conn_has_connected:
+                self._conn_reconnects += 1
+            self._conn_has_connected = True
+            self._conn_failures = 0
+            self._conn_state = ConnectionState.Connected
+
+    def _set_connection_closed(self, was_connected):
+        """Update connection state when remote connection is closed."""
+        with self._conn_lock:
+            if self._conn_state == ConnectionState.Disconnected:
+                # connection closed on request, no backoff required
+                return
+            self._conn_failures = 1 if was_connected else self._conn_failures + 1
+            delay = min(
+                BACKOFF_BASE_DELAY * 2 ** (self._conn_failures - 1), BACKOFF_MAX_DELAY
+            )
+            delay *= random.uniform(1 - BACKOFF_JITTER, 1 + BACKOFF_JITTER)
+            self._backoff_until = time.monotonic() + delay
+            self._conn_state = ConnectionState.Backoff
+        _LOGGING.debug(
+            "Connection to %s closed, failures: %s, next attempt in %.1fs",
+            self.host,
+            self._conn_failures,
+            delay,
+        )
 
     def _client_remote_thread(self):
         if self._ws_remote:
             return
 
         is_ssl = self._is_ssl_connection()
-        url = self._format_websocket_url(_WS_ENDPOINT_REMOTE_CONTROL, is_ssl=is_ssl)
-        sslopt = {"cert_reqs": ssl.CERT_NONE} if is_ssl else {}
-
-        websocket.setdefaulttimeout(self.timeout)
-        self._ws_remote = websocket.WebSocketApp(
-            url,
+        ws_remote = self._create_ws_app(
+            _WS_ENDPOINT_REMOTE_CONTROL,
+            is_ssl,
             on_message=self._on_message_remote,
             on_ping=self._on_ping_remote,
         )
+        if ws_remote is None:
+            self._set_connection_closed(False)
+            return
+
+        self._ws_remote = ws_remote
         _LOGGING.debug("Thread SamsungRemote started")
         # we set ping interval (1 hour) only to enable multi-threading mode
         # on socket. TV do not answer to ping but send ping to client
-        self._run_forever(self._ws_remote, sslopt=sslopt, ping_interval=3600)
+        self._run_forever(self._ws_remote, ping_interval=3600)
+        was_connected = self._is_connected
         self._is_connected = False
+        self._save_tls_session(self._ws_remote.prepared_socket)
         if self._ws_art:
-            self._ws_art.close()
+            self._close_ws_app(self._ws_art)
         if self._ws_control:
-            self._ws_control.close()
+            self._close_ws_app(self._ws_control)
         self._ws_remote.close()
         self._ws_remote = None
         _LOGGING.debug("Thread SamsungRemote terminated")
+        self._set_connection_closed(was_connected)
+        if was_connected:
+            self._notify_status(False)
 
     def _on_ping_remote(self, _, payload):
         _LOGGING.debug("Received WS remote ping %s, sending pong", payload)
@@ -430,13 +767,16 @@ class SamsungTVWS:
             if token:
                 self._set_token(token)
             self._is_connected = True
+            self._set_connection_open()
             self._request_apps_list()
             self.start_client(start_all=True)
+            self._notify_status(True)
         elif event == "ed.installedApp.get":
             _LOGGING.debug("Message remote: received installedApp")
             self._handle_installed_app(response)
         elif event == "ed.edenTV.update":
             _LOGGING.debug("Message remote: received edenTV")
+            self._notify_event(EVENT_TV_UPDATE)
             self.get_running_app(force_scan=True)
 
     def _request_apps_list(self):
@@ -447,38 +787,80 @@ class SamsungTVWS:
                 "params": {"event": "ed.installedApp.get", "to": "host"},
             },
             key_press_delay=0,
+            priority=SendPriority.Launch,
         )
 
-    def _handle_installed_app(self, response):
-        list_app = response.get("data", {}).get("data")
+    @staticmethod
+    def _gen_installed_app_hash(installed_app):
+        """Generate a hash that identify the content of installed app list."""
+        content = sorted(
+            (app.app_id, app.app_name, app.app_type) for app in installed_app.values()
+        )
+        return hashlib.sha1(json.dumps(content).encode("utf-8")).hexdigest()
+
+    def _set_installed_app(self, list_app):
+        """Set installed app list and return True if changed."""
         installed_app = {}
         for app_info in list_app:
             app_id = app_info["appId"]
-            _LOGGING.debug("Found app: %s", app_id)
             app = App(app_id, app_info["name"], app_info["app_type"])
             installed_app[app_id] = app
-        self._installed_app = installed_app
+
+        app_hash = self._gen_installed_app_hash(installed_app)
+        if app_hash == self._installed_app_hash:
+            return False
+
+        added = installed_app.keys() - self._installed_app.keys()
+        removed = self._installed_app.keys() - installed_app.keys()
+        _LOGGING.debug("Installed app added: %s, removed: %s", added, removed)
+        with self._app_lock:
+            self._installed_app = installed_app
+            self._installed_app_hash = app_hash
+            self._app_to_check = None
+        return True
+
+    def _handle_installed_app(self, response):
+        # an empty list is valid, it means that all apps were removed
+        list_app = response.get("data", {}).get("data")
+        if list_app is None:
+            return
+        if not self._set_installed_app(list_app):
+            _LOGGING.debug("Installed app list not changed")
+            return
+        if self._installed_app_callback is not None:
+            self._installed_app_callback()
+
+    def restore_installed_app(self, list_app):
+        """Restore the installed app list previously saved."""
+        self._set_installed_app(list_app)
+
+    def get_installed_app_data(self):
+        """Return the installed app list in the format used by TV."""
+        return [
+            {"appId": app.app_id, "name": app.app_name, "app_type": app.app_type}
+            for app in self._installed_app.values()
+        ]
 
     def _client_control_thread(self):
         if self._ws_control:
             return
 
-        is_ssl = self._is_ssl_connection()
-        url = self._format_websocket_url(
-            _WS_ENDPOINT_APP_CONTROL, is_ssl=is_ssl, use_token=False
-        )
-        sslopt = {"cert_reqs": ssl.CERT_NONE} if is_ssl else {}
-
-        websocket.setdefaulttimeout(self.timeout)
-        self._ws_control = websocket.WebSocketApp(
-            url,
+        ws_control = self._create_ws_app(
+            _WS_ENDPOINT_APP_CONTROL,
+            self._is_ssl_connection(),
+            use_token=False,
             on_message=self._on_message_control,
             on_ping=self._on_ping_control,
         )
+        if ws_control is None:
+            return
+
+        self._ws_control = ws_control
         _LOGGING.debug("Thread SamsungControl started")
         # we set ping interval (1 hour) only to enable multi-threading mode
         # on socket. TV do not answer to ping but send ping to client
-        self._run_forever(self._ws_control, sslopt=sslopt, ping_interval=3600)
+        self._run_forever(self._ws_control, ping_interval=3600)
+        self._save_tls_session(self._ws_control.prepared_socket)
         self._ws_control.close()
         self._ws_control = None
         _LOGGING.debug("Thread SamsungControl terminated")
@@ -530,6 +912,7 @@ class SamsungTVWS:
         if is_running is None:
             return
 
+        prev_running_app = self._running_app
         if self._running_app:
             if is_running and app_id != self._running_app:
                 _LOGGING.debug("app running: %s", app_id)
@@ -541,6 +924,12 @@ class SamsungTVWS:
             _LOGGING.debug("app running: %s", app_id)
             self._running_app = app_id
 
+        if self._running_app != prev_running_app:
+            with self._app_waiters_lock:
+                for loop, event in self._app_waiters:
+                    loop.call_soon_threadsafe(event.set)
+            self._notify_event(EVENT_APP_CHANGED, self._running_app)
+
     def _manage_control_err(self, response):
         app_id = response.get("id")
         if not app_id:
@@ -559,7 +948,9 @@ class SamsungTVWS:
             #     )
             #     self._app_type[app_id] = 4
 
-    def _get_app_status(self, app_id, app_type):
+    def _get_app_status(
+        self, app_id, app_type, priority=SendPriority.Background, *, wait=True
+    ):
         _LOGGING.debug("Get app status: AppID: %s, AppType: %s", app_id, app_type)
 
         # if app_type == 4:
@@ -579,28 +970,30 @@ class SamsungTVWS:
             key_press_delay=0,
             use_control=True,
             ws_socket=self._ws_control,
+            priority=priority,
+            wait=wait,
         )
 
     def _client_art_thread(self):
         if self._ws_art:
             return
 
-        is_ssl = self._is_ssl_connection()
-        url = self._format_websocket_url(
-            _WS_ENDPOINT_ART, is_ssl=is_ssl, use_token=False
-        )
-        sslopt = {"cert_reqs": ssl.CERT_NONE} if is_ssl else {}
-
-        websocket.setdefaulttimeout(self.timeout)
-        self._ws_art = websocket.WebSocketApp(
-            url,
+        ws_art = self._create_ws_app(
+            _WS_ENDPOINT_ART,
+            self._is_ssl_connection(),
+            use_token=False,
             on_message=self._on_message_art,
             on_ping=self._on_ping_art,
         )
+        if ws_art is None:
+            return
+
+        self._ws_art = ws_art
         _LOGGING.debug("Thread SamsungArt started")
         # we set ping interval (1 hour) only to enable multi-threading mode
         # on socket. TV do not answer to ping but send ping to client
-        self._run_forever(self._ws_art, sslopt=sslopt, ping_interval=3600)
+        self._run_forever(self._ws_art, ping_interval=3600)
+        self._save_tls_session(self._ws_art.prepared_socket)
         self._ws_art.close()
         self._ws_art = None
         _LOGGING.debug("Thread SamsungArt terminated")
@@ -655,6 +1048,7 @@ class SamsungTVWS:
             key_press_delay=0,
             use_control=True,
             ws_socket=self._ws_art,
+            priority=SendPriority.Background,
         )
 
     def _handle_artmode_status(self, response):
@@ -705,22 +1099,30 @@ class SamsungTVWS:
     def installed_app(self):
         return self._installed_app
 
+    @property
+    def installed_app_hash(self):
+        return self._installed_app_hash
+
     @property
     def running_app(self):
         return self._running_app
 
-    def ping_device(self, port=0):
+    def ping_device(self, port=0, *, power_on=None):
         """Ping TV device to check current status, and return boolean.
         If port is specified, try to open specific port
         for check, otherwise it uses ICMP echo
-        If check is True, try to open WS connection
+        If power_on is specified (e.g. retrieved with rest api),
+        ping is skipped and the value is used as result
         """
-        result = self._ping.ping(port)
-        # check ws ping/pong
         call_time = datetime.utcnow()
-        if result and self._ws_remote:
-            difference = (call_time - self._last_ping).total_seconds()
-            result = difference < MAX_WS_PING_INTERVAL
+        if power_on is None:
+            result = self._ping.ping(port)
+            # check ws ping/pong
+            if result and self._ws_remote:
+                difference = (call_time - self._last_ping).total_seconds()
+                result = difference < MAX_WS_PING_INTERVAL
+        else:
+            result = power_on
 
         if not result:
             self.stop_client()
@@ -743,7 +1145,7 @@ class SamsungTVWS:
             difference = (datetime.utcnow() - self._last_art_ping).total_seconds()
             if difference >= MAX_WS_PING_INTERVAL:
                 self._artmode_status = ArtModeStatus.Unavailable
-                self._ws_art.close()
+                self._close_ws_app(self._ws_art)
         elif self._ws_remote:
             self.start_client(start_all=True)
 
@@ -756,25 +1158,79 @@ class SamsungTVWS:
     def set_power_off_request(self):
         self._power_on_requested = False
 
-    def get_running_app(self, *, force_scan=False):
-
-        if not self._ws_control:
-            return
-
+    def _start_app_scan(self, force_scan=False):
+        """Return True if a new scan of running app can start."""
         with self._sync_lock:
             call_time = datetime.utcnow()
             difference = (call_time - self._last_app_scan).total_seconds()
             if (
                 difference < MIN_APP_SCAN_INTERVAL and not force_scan
             ) or difference < 1:
-                return
+                return False
             self._last_app_scan = call_time
+        return True
+
+    def get_running_app(self, *, force_scan=False):
+
+        if not self._ws_control:
+            return
+
+        if not self._start_app_scan(force_scan):
+            return
 
-        if self._app_list is not None:
+        # a new scan replace status requests of the previous one still queued
+        self._send_queues[_CHANNEL_CONTROL].cancel_pending(SendPriority.Background)
+        for app in self._get_app_to_check().values():
+            self._get_app_status(app.app_id, app.app_type)
+
+    async def async_rest_get_running_app(self, *, force_scan=False):
+        """
+        Scan running app using rest api when control channel is not connected.
+        Status of all the apps is requested with a single batch.
+        """
+        if self._ws_control or not self._start_app_scan(force_scan):
+            return
+
+        # app type 4 always return not found error
+        app_ids = [
+            app.app_id for app in self._get_app_to_check().values() if app.app_type != 4
+        ]
+        if not app_ids:
+            return
+
+        app_status = await self.async_rest_app_status_many(app_ids)
+        # running app change is notified with callbacks called from a thread
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._set_running_app_status, app_status
+        )
+
+    def _set_running_app_status(self, app_status):
+        """Update running app with the status received from rest api."""
+        for app_id, status in app_status.items():
+            if status:
+                self._set_running_app({"id": app_id, "result": status})
+
+    def set_app_list(self, app_list):
+        """Set the apps to scan, None to scan all the installed apps."""
+        with self._app_lock:
+            self._app_list = app_list
+            self._app_to_check = None
+
+    def _get_app_to_check(self):
+        """Return the apps to scan, rebuilt only when installed apps change."""
+        with self._app_lock:
+            if self._app_to_check is not None:
+                return self._app_to_check
+
+            if self._app_list is None:
+                return self._installed_app
+
+            # installed apps are available once received from TV or restored
+            app_loaded = self._installed_app_hash is not None
             app_to_check = {}
             for app_name, app_id in self._app_list.items():
                 app = None
-                if self._installed_app:
+                if app_loaded:
                     app = self._installed_app.get(app_id)
                 else:
                     app_type = self._app_type.get(app_id, 2)
@@ -782,16 +1238,30 @@ class SamsungTVWS:
                         app = App(app_id, app_name, app_type)
                 if app:
                     app_to_check[app_id] = app
-        else:
-            app_to_check = self._installed_app
 
-        for app in app_to_check.values():
-            self._get_app_status(app.app_id, app.app_type)
+            if app_loaded:
+                self._app_to_check = app_to_check
+            return app_to_check
+
+    def start_client(self, *, start_all=False, force=False):
+        """
+        Start all thread that connect to the TV websocket.
+        Remote connection is not started while in backoff after a failure,
+        unless force is set (e.g. TV detected on after power on).
+        """
 
-    def start_client(self, *, start_all=False):
-        """Start all thread that connect to the TV websocket"""
+        if self._is_shutdown:
+            return
 
         if self._client_remote is None or not self._client_remote.is_alive():
+            with self._conn_lock:
+                if (
+                    not force
+                    and self._conn_state == ConnectionState.Backoff
+                    and time.monotonic() < self._backoff_until
+                ):
+                    return
+                self._conn_state = ConnectionState.Connecting
             self._client_remote = Thread(target=self._client_remote_thread)
             self._client_remote.name = "SamsungRemote"
             self._client_remote.setDaemon(True)
@@ -818,8 +1288,38 @@ class SamsungTVWS:
                 self._client_art.start()
 
     def stop_client(self):
+        with self._conn_lock:
+            self._conn_state = ConnectionState.Disconnected
+            self._conn_failures = 0
+            self._backoff_until = 0.0
+        for queue in self._send_queues.values():
+            queue.clear()
         if self._ws_remote:
-            self._ws_remote.close()
+            self._close_ws_app(self._ws_remote)
+
+    def shutdown(self, timeout=SHUTDOWN_TIMEOUT):
+        """
+        Close all the connections and wait for threads to terminate.
+        Return the name of threads still alive after the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        self._is_shutdown = True
+        self.stop_client()
+        for ws_app in (self._ws_control, self._ws_art):
+            if ws_app:
+                self._close_ws_app(ws_app)
+        self.close()
+
+        threads = [self._client_remote, self._client_control, self._client_art]
+        threads.extend(queue.shutdown() for queue in self._send_queues.values())
+        alive = []
+        for thread in threads:
+            if thread is None:
+                continue
+            thread.join(max(deadline - time.monotonic(), 0))
+            if thread.is_alive():
+                alive.append(thread.name)
+        return alive
 
     def open(self):
         if self.connection is not None:
@@ -827,10 +1327,11 @@ class SamsungTVWS:
 
         is_ssl = self._is_ssl_connection()
         url = self._format_websocket_url(_WS_ENDPOINT_REMOTE_CONTROL, is_ssl=is_ssl)
-        sslopt = {"cert_reqs": ssl.CERT_NONE} if is_ssl else {}
 
         _LOGGING.debug("WS url %s", url)
-        connection = websocket.create_connection(url, self.timeout, sslopt=sslopt)
+        connection = websocket.create_connection(
+            url, self.timeout, socket=self._create_socket(is_ssl)
+        )
         completed = False
         response = ""
 
@@ -857,6 +1358,7 @@ class SamsungTVWS:
 
     def close(self):
         if self.connection:
+            self._save_tls_session(self.connection.sock)
             self.connection.close()
             _LOGGING.debug("Connection closed.")
         self.connection = None
@@ -876,11 +1378,21 @@ class SamsungTVWS:
             key_press_delay,
         )
 
-    def hold_key(self, key, seconds):
-        if self.send_key(key, key_press_delay=0, cmd="Press"):
-            time.sleep(seconds)
-            return self.send_key(key, key_press_delay=0, cmd="Release")
-        return False
+    def send_keys(self, key, count=1, key_press_delay=None):
+        """Send a key repeated, using key_repeat_delay between repeats."""
+        for index in range(count):
+            delay = key_press_delay if index == count - 1 else self.key_repeat_delay
+            if not self.send_key(key, delay):
+                return False
+        return True
+
+    def send_key_sequence(self, keys, key_delay=None):
+        """Send a sequence of keys using the same delay between keys."""
+        for index, key in enumerate(keys):
+            delay = key_delay if index < len(keys) - 1 else 0
+            if not self.send_key(key, delay):
+                return False
+        return True
 
     def send_text(self, text, send_delay=None):
         if not text:
@@ -912,7 +1424,7 @@ class SamsungTVWS:
         return False
 
     def move_cursor(self, x, y, duration=0):
-        self._ws_send(
+        return self._ws_send(
             {
                 "method": "ms.remote.control",
                 "params": {
@@ -924,14 +1436,33 @@ class SamsungTVWS:
             key_press_delay=0,
         )
 
+    def send_pointer_frame(self, dx, dy, clicks=0):
+        """Send a pointer movement followed by clicks."""
+        result = True
+        if dx or dy:
+            result = self.move_cursor(dx, dy)
+        for _ in range(clicks):
+            result = self._ws_send(
+                {
+                    "method": "ms.remote.control",
+                    "params": {
+                        "Cmd": "LeftClick",
+                        "TypeOfRemote": "ProcessMouseDevice",
+                    },
+                },
+                key_press_delay=0,
+            )
+        return result
+
+    def _get_app_type(self, app_id):
+        if app := self._installed_app.get(app_id):
+            return app.app_type
+        return self._app_type.get(app_id, 2)
+
     def run_app(self, app_id, action_type="", meta_tag="", *, use_remote=False):
 
         if not action_type:
-            app = self._installed_app.get(app_id)
-            if app:
-                app_type = app.app_type
-            else:
-                app_type = self._app_type.get(app_id, 2)
+            app_type = self._get_app_type(app_id)
             action_type = TYPE_DEEP_LINK if app_type == 2 else TYPE_NATIVE_LAUNCH
         elif action_type != TYPE_NATIVE_LAUNCH:
             action_type = TYPE_DEEP_LINK
@@ -953,6 +1484,7 @@ class SamsungTVWS:
                 key_press_delay=0,
                 use_control=True,
                 ws_socket=self._ws_control,
+                priority=SendPriority.Launch,
             )
 
         return self._ws_send(
@@ -971,36 +1503,168 @@ class SamsungTVWS:
                 },
             },
             key_press_delay=0,
+            priority=SendPriority.Launch,
+        )
+
+    def _sort_launch_methods(self, app_id, methods):
+        """Sort launch methods, fastest for this app first and failed last."""
+        app_stats = self._launch_stats.get(app_id, {})
+
+        def sort_key(item):
+            index, method = item
+            if (stats := app_stats.get(method)) is None:
+                return 1, 0, index
+            if stats.success >= stats.failure:
+                return 0, stats.avg_latency, index
+            return 2, stats.failure - stats.success, index
+
+        return [method for _, method in sorted(enumerate(methods), key=sort_key)]
+
+    async def _async_send_launch(self, app_id, method, action_type, meta_tag):
+        """Send the command to launch an app using a specific method."""
+        if method == APP_LAUNCH_REST:
+            return await self._rest_api.async_app_run(app_id) is not None
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(
+                self.run_app,
+                app_id,
+                action_type,
+                meta_tag,
+                use_remote=method == APP_LAUNCH_REMOTE,
+            ),
         )
 
+    async def _async_wait_app_running(self, app_id, wait_time):
+        """Wait for the TV to report the app running, return False on timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_time
+        event = asyncio.Event()
+        waiter = (loop, event)
+        with self._app_waiters_lock:
+            self._app_waiters.append(waiter)
+        try:
+            while True:
+                event.clear()
+                if self._running_app == app_id:
+                    return True
+                if (remaining := deadline - loop.time()) <= 0:
+                    return False
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return self._running_app == app_id
+        finally:
+            with self._app_waiters_lock:
+                self._app_waiters.remove(waiter)
+
+    async def _async_wait_app_visible(self, app_id, deadline):
+        """Wait until the TV report the app visible, return False on timeout."""
+        app_type = self._get_app_type(app_id)
+        use_control = self._ws_control is not None and app_type != 4
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            wait_time = min(remaining, APP_STATUS_INTERVAL)
+            if use_control:
+                # status request is queued without blocking the event loop
+                self._get_app_status(app_id, app_type, SendPriority.Launch, wait=False)
+                if await self._async_wait_app_running(app_id, wait_time):
+                    return True
+                continue
+
+            status = await self._rest_api.async_app_status(app_id)
+            if status and status.get("visible"):
+                return True
+            await asyncio.sleep(wait_time)
+
+        return False
+
+    async def async_launch_app(
+        self,
+        app_id,
+        methods: Optional[List[str]] = None,
+        *,
+        action_type="",
+        meta_tag="",
+        timeout=APP_LAUNCH_TIMEOUT,
+    ):
+        """
+        Launch an app and wait until the TV report it visible.
+        Methods are tried starting from the fastest measured for the app,
+        if app is not visible before timeout the next method is used.
+        Return the method that launched the app, None if all failed.
+        """
+        for method in self._sort_launch_methods(app_id, methods or APP_LAUNCH_METHODS):
+            start_time = time.monotonic()
+            if not await self._async_send_launch(app_id, method, action_type, meta_tag):
+                continue
+
+            app_stats = self._launch_stats.setdefault(app_id, {})
+            stats = app_stats.setdefault(method, LaunchStats())
+            visible = await self._async_wait_app_visible(app_id, start_time + timeout)
+            if not visible:
+                # before falling back check again, a slow cold start may have
+                # completed after the deadline and the app must not be relaunched
+                visible = await self._async_wait_app_visible(
+                    app_id, time.monotonic() + APP_STATUS_INTERVAL
+                )
+            if visible:
+                latency = time.monotonic() - start_time
+                stats.add_result(latency)
+                _LOGGING.debug(
+                    "App %s launched with method %s in %.2fs", app_id, method, latency
+                )
+                return method
+
+            stats.add_result(None)
+            _LOGGING.debug("App %s not visible using method %s", app_id, method)
+
+        _LOGGING.warning("Failed to launch app %s", app_id)
+        return None
+
+    def get_launch_stats(self):
+        """Return the app launch statistics."""
+        return {
+            app_id: {method: stats.as_dict() for method, stats in app_stats.items()}
+            for app_id, app_stats in self._launch_stats.items()
+        }
+
     def open_browser(self, url):
         _LOGGING.debug("Opening url in browser %s", url)
         return self.run_app("org.tizen.browser", TYPE_NATIVE_LAUNCH, url)
 
-    def rest_device_info(self):
-        _LOGGING.debug("Get device info via rest api")
-        response = self._rest_request("")
-        return self._process_api_response(response.text, raise_error=False)
-
-    def rest_app_status(self, app_id):
-        _LOGGING.debug("Get app %s status via rest api", app_id)
-        response = self._rest_request("applications/" + app_id)
-        return self._process_api_response(response.text, raise_error=False)
-
-    def rest_app_run(self, app_id):
-        _LOGGING.debug("Run app %s via rest api", app_id)
-        response = self._rest_request("applications/" + app_id, "POST")
-        return self._process_api_response(response.text, raise_error=False)
-
-    def rest_app_close(self, app_id):
-        _LOGGING.debug("Close app %s via rest api", app_id)
-        response = self._rest_request("applications/" + app_id, "DELETE")
-        return self._process_api_response(response.text, raise_error=False)
-
-    def rest_app_install(self, app_id):
-        _LOGGING.debug("Install app %s via rest api", app_id)
-        response = self._rest_request("applications/" + app_id, "PUT")
-        return self._process_api_response(response.text, raise_error=False)
+    @property
+    def rest_api(self) -> SamsungTVAsyncRest:
+        """Return the async rest api client."""
+        return self._rest_api
+
+    async def async_rest_power_state(self):
+        """Get the TV power state using async rest api."""
+        return await self._rest_api.async_power_state()
+
+    async def async_rest_device_info(self):
+        """Get device info using async rest api."""
+        return await self._rest_api.async_device_info()
+
+    async def async_rest_app_status(self, app_id):
+        """Get app status using async rest api."""
+        return await self._rest_api.async_app_status(app_id)
+
+    async def async_rest_app_status_many(self, app_ids):
+        """Get multiple apps status using async rest api."""
+        return await self._rest_api.async_app_status_many(app_ids)
+
+    async def async_rest_app_run(self, app_id):
+        """Run app using async rest api."""
+        return await self._rest_api.async_app_run(app_id)
+
+    async def async_rest_app_close(self, app_id):
+        """Close app using async rest api."""
+        return await self._rest_api.async_app_close(app_id)
+
+    async def async_rest_app_install(self, app_id):
+        """Install app using async rest api."""
+        return await self._rest_api.async_app_install(app_id)
 
     def shortcuts(self):
         return shortcuts.SamsungTVShortcuts(self)
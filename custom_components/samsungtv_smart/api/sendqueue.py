@@ -0,0 +1,145 @@
+"""
+SamsungTV Smart send queue - ordered outbound commands for a connection
+
+Copyright (C) 2020 Ollo69
+
+    This library is free software; you can redistribute it and/or
+    modify it under the terms of the GNU Lesser General Public
+    License as published by the Free Software Foundation; either
+    version 2.1 of the License, or (at your option) any later version.
+
+    This library is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+    Lesser General Public License for more details.
+
+    You should have received a copy of the GNU Lesser General Public
+    License along with this library; if not, write to the Free Software
+    Foundation, Inc., 51 Franklin Street, Fifth Floor,
+    Boston, MA  02110-1335  USA
+
+"""
+from concurrent.futures import Future
+from enum import IntEnum
+import heapq
+from itertools import count
+import logging
+from threading import Condition, Thread, get_ident
+from typing import Any, Callable, List, Optional
+
+IDLE_TIMEOUT = 60
+
+_LOGGING = logging.getLogger(__name__)
+
+
+class SendPriority(IntEnum):
+    """Priority lanes of the send queue, lower value is sent first."""
+
+    User = 0
+    Launch = 1
+    Background = 2
+
+
+class SendQueue:
+    """
+    Outbound queue for a single websocket connection.
+    Commands are sent by a worker thread in priority order and in
+    submission order inside the same priority. The worker is started
+    on first submit and terminate after an idle period.
+    """
+
+    def __init__(self, name: str, idle_timeout=IDLE_TIMEOUT):
+        """Initialize SendQueue object."""
+        self._name = name
+        self._idle_timeout = idle_timeout
+        self._queue: List[tuple] = []
+        self._seq = count()
+        self._cond = Condition()
+        self._worker: Optional[Thread] = None
+        self._worker_id: Optional[int] = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Return the number of commands waiting to be sent."""
+        with self._cond:
+            return len(self._queue)
+
+    def is_worker_thread(self) -> bool:
+        """Return True if called from the worker thread."""
+        return self._worker_id == get_ident()
+
+    def submit(
+        self, func: Callable[[], Any], priority=SendPriority.User
+    ) -> "Future[Any]":
+        """Queue a send function and return the future with its result."""
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                future.cancel()
+                return future
+            heapq.heappush(self._queue, (priority, next(self._seq), func, future))
+            if self._worker is None:
+                self._worker = Thread(target=self._run, name=self._name, daemon=True)
+                self._worker.start()
+            self._cond.notify()
+        return future
+
+    def cancel_pending(self, min_priority=SendPriority.Background) -> int:
+        """Cancel queued commands with priority lower or equal to min_priority."""
+        with self._cond:
+            keep = []
+            cancelled = 0
+            for item in self._queue:
+                if item[0] >= min_priority:
+                    item[3].cancel()
+                    cancelled += 1
+                else:
+                    keep.append(item)
+            if cancelled:
+                heapq.heapify(keep)
+                self._queue = keep
+        if cancelled:
+            _LOGGING.debug("%s: cancelled %s queued commands", self._name, cancelled)
+        return cancelled
+
+    def clear(self) -> None:
+        """Cancel all queued commands."""
+        self.cancel_pending(SendPriority.User)
+
+    def shutdown(self) -> Optional[Thread]:
+        """
+        Cancel queued commands and stop the worker.
+        Return the worker thread to join, None if not running.
+        """
+        with self._cond:
+            self._closed = True
+            worker = self._worker
+            self._cond.notify_all()
+        self.clear()
+        return worker
+
+    def _run(self) -> None:
+        """Send queued commands until the queue remain idle."""
+        self._worker_id = get_ident()
+        while True:
+            with self._cond:
+                if (
+                    not self._cond.wait_for(
+                        lambda: self._queue or self._closed, self._idle_timeout
+                    )
+                    or self._closed
+                ):
+                    self._worker = None
+                    self._worker_id = None
+                    return
+                _, _, func, future = heapq.heappop(self._queue)
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = func()
+            except Exception as exc:  # pylint: disable=broad-except
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
@@ -204,6 +204,32 @@ class SmartThingsTV:
                 return map_value.get("name", "")
         return ""
 
+    def get_restore_data(self) -> dict:
+        """Return the data to save for restore at startup."""
+        return {
+            "state": self._state.value,
+            "source_list": self._source_list,
+            "source_list_map": self._source_list_map,
+            "sound_mode": self._sound_mode,
+            "sound_mode_list": self._sound_mode_list,
+            "picture_mode": self._picture_mode,
+            "picture_mode_list": self._picture_mode_list,
+        }
+
+    def restore_data(self, data: dict):
+        """Restore the last known status, before the first update."""
+        try:
+            self._state = STStatus(data.get("state", STStatus.STATE_UNKNOWN.value))
+        except ValueError:
+            self._state = STStatus.STATE_UNKNOWN
+        self._prev_state = self._state
+        self._source_list = data.get("source_list")
+        self._source_list_map = data.get("source_list_map")
+        self._sound_mode = data.get("sound_mode")
+        self._sound_mode_list = data.get("sound_mode_list")
+        self._picture_mode = data.get("picture_mode")
+        self._picture_mode_list = data.get("picture_mode_list")
+
     def set_application(self, app_id):
         """Set running application info."""
         if self._use_channel_info:
@@ -440,6 +466,36 @@ class SmartThingsTV:
             self._channel = ""
             self._channel_name = ""
 
+    async def async_get_input_source(self) -> Optional[str]:
+        """
+        Refresh and return the current input source, without updating
+        the cached status. Return None if not available.
+        """
+        device_id = self._device_id
+        if not device_id:
+            return None
+
+        api_device_status = f"{API_DEVICES}/{device_id}/states"
+        try:
+            await self._device_refresh()
+            async with self._session.get(
+                api_device_status,
+                headers=_headers(self._api_key),
+                raise_for_status=True,
+            ) as resp:
+                data = await resp.json()
+        except (
+            AsyncTimeoutError,
+            ClientConnectionError,
+            ClientResponseError,
+        ):
+            return None
+
+        device_source = data.get("main", {}).get("inputSource", {}).get("value", "")
+        if device_source.upper() == DIGITAL_TV.upper():
+            return DIGITAL_TV
+        return device_source or None
+
     async def async_turn_off(self):
         """Turn off TV via SmartThings"""
         data_cmd = _command(COMMAND_POWER_OFF)
@@ -0,0 +1,178 @@
+"""
+SamsungTV Smart Wake-on-LAN - async magic packet sender
+
+Copyright (C) 2020 Ollo69
+
+    This library is free software; you can redistribute it and/or
+    modify it under the terms of the GNU Lesser General Public
+    License as published by the Free Software Foundation; either
+    version 2.1 of the License, or (at your option) any later version.
+
+    This library is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+    Lesser General Public License for more details.
+
+    You should have received a copy of the GNU Lesser General Public
+    License along with this library; if not, write to the Free Software
+    Foundation, Inc., 51 Franklin Street, Fifth Floor,
+    Boston, MA  02110-1335  USA
+
+"""
+import asyncio
+import logging
+import socket
+from typing import Iterable, List, Optional, Set, Tuple
+
+from wakeonlan import create_magic_packet
+
+BROADCAST_ADDRESS = "255.255.255.255"
+COALESCE_DELAY = 0.02
+REPEAT_INTERVAL = 0.25
+WOL_PORT = 9
+
+_LOGGING = logging.getLogger(__name__)
+
+
+class _WolProtocol(asyncio.DatagramProtocol):
+    """Collect the errors reported by the datagram socket."""
+
+    def __init__(self):
+        self.errors: List[OSError] = []
+
+    def error_received(self, exc):
+        self.errors.append(exc)
+
+
+class AsyncWakeOnLan:
+    """
+    Send WOL magic packets using a single broadcast datagram socket.
+    Requests received in a short interval are merged in a single batch,
+    and repeats for all targets are interleaved on the same schedule.
+    """
+
+    def __init__(self, port=WOL_PORT):
+        """Initialize AsyncWakeOnLan object."""
+        self._port = port
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._protocol: Optional[_WolProtocol] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._transport_lock: Optional[asyncio.Lock] = None
+        self._pending: List[tuple] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    async def _async_get_transport(
+        self,
+    ) -> Tuple[asyncio.DatagramTransport, _WolProtocol]:
+        """Return the broadcast transport and protocol, created on first use."""
+        if self._transport_lock is None:
+            self._transport_lock = asyncio.Lock()
+        async with self._transport_lock:
+            if self._transport is None or self._transport.is_closing():
+                loop = asyncio.get_running_loop()
+                self._transport, self._protocol = await loop.create_datagram_endpoint(
+                    _WolProtocol,
+                    family=socket.AF_INET,
+                    allow_broadcast=True,
+                )
+        return self._transport, self._protocol
+
+    def close(self):
+        """Close the socket and cancel pending requests."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for *_, future in self._pending:
+            if not future.done():
+                future.cancel()
+        self._pending = []
+        for task in self._tasks:
+            task.cancel()
+        if self._transport:
+            self._transport.close()
+            self._transport = None
+
+    async def async_send_batch(
+        self, targets: Iterable[Tuple[str, Optional[str], int]]
+    ) -> List[bool]:
+        """
+        Send magic packets to a batch of (mac, broadcast address, repeat)
+        and return when all packets are sent.
+        Return for each target True if packets were sent. Errors reported
+        by the socket cannot be related to a target, so all the targets of
+        the batch fail if the socket report an error while sending.
+        """
+        packets = []
+        for mac, address, repeat in targets:
+            try:
+                packet = create_magic_packet(mac)
+            except (TypeError, ValueError) as exc:
+                _LOGGING.error("Error creating WOL packet for %s: %s", mac, exc)
+                packet = None
+            packets.append((packet, (address or BROADCAST_ADDRESS, self._port), repeat))
+
+        results = [False] * len(packets)
+        if not any(packet for packet, *_ in packets):
+            return results
+
+        try:
+            transport, protocol = await self._async_get_transport()
+        except OSError as exc:
+            _LOGGING.warning("Failed to open WOL socket: %s", exc)
+            return results
+
+        protocol.errors.clear()
+        for round_nr in range(max(repeat for *_, repeat in packets)):
+            if round_nr > 0:
+                await asyncio.sleep(REPEAT_INTERVAL)
+            for index, (packet, address, repeat) in enumerate(packets):
+                if packet is None or round_nr >= repeat:
+                    continue
+                transport.sendto(packet, address)
+                results[index] = True
+
+        # errors are reported asynchronously by the protocol
+        await asyncio.sleep(0)
+        if protocol.errors:
+            _LOGGING.warning("Failed to send WOL packets: %s", protocol.errors)
+            return [False] * len(packets)
+
+        return results
+
+    async def async_send(
+        self, mac: str, address: Optional[str] = None, repeat: int = 1
+    ) -> bool:
+        """
+        Send magic packets to a device, requests from multiple callers
+        are merged in the same batch. Return True if packet was sent.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((mac, address, max(repeat, 1), future))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(COALESCE_DELAY, self._flush)
+        return await future
+
+    def _flush(self):
+        """Send all the pending requests in a single batch."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._async_send_pending(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _async_send_pending(self, pending: List[tuple]):
+        """Send a batch and set the result of waiting callers."""
+        try:
+            results = await self.async_send_batch(
+                [(mac, address, repeat) for mac, address, repeat, _ in pending]
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            for *_, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (*_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
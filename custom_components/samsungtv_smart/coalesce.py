@@ -0,0 +1,120 @@
+"""Coalesce bursts of repeated commands sent to SamsungTV Smart."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+KEY_REPEAT_WINDOW = 0.3
+MAX_KEY_REPEAT = 20
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class KeyRepeatCoalescer:
+    """
+    Merge repeated presses of the same key in a single repeat sequence, so
+    the TV receive the burst at once instead of a backlog of commands each
+    followed by the key delay. The first press is sent immediately and only
+    the repeats received within a short window after it are merged.
+    Keys are sent in order, a press of a different key flush the pending
+    burst and other commands must call async_flush before being sent.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_method: Callable[[str, int], Awaitable[bool]],
+        window=KEY_REPEAT_WINDOW,
+    ):
+        """Initialize the object."""
+        self._hass = hass
+        self._send_method = send_method
+        self._window = window
+        self._key: str | None = None
+        self._count = 0
+        self._future: asyncio.Future | None = None
+        self._handle: asyncio.TimerHandle | None = None
+        self._send_lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    async def async_press(self, key: str) -> bool:
+        """Add a key press to the burst and return the result of the send."""
+        if self._key is not None and key != self._key:
+            await self.async_flush()
+
+        if self._key is None:
+            # first press open the window for the repeats and is sent now
+            self._key = key
+            self._count = 0
+            self._handle = self._hass.loop.call_later(self._window, self._flush)
+            return await asyncio.shield(self._start_send(key, 1))
+
+        if self._future is None:
+            self._future = self._hass.loop.create_future()
+        future = self._future
+        self._count += 1
+        if self._count >= MAX_KEY_REPEAT:
+            self._flush()
+        return await asyncio.shield(future)
+
+    async def async_flush(self) -> None:
+        """Send the pending burst and wait until all keys are sent."""
+        self._flush()
+        if self._tasks:
+            await asyncio.wait(list(self._tasks))
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the pending burst and the keys not yet sent."""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        if self._future and not self._future.done():
+            self._future.cancel()
+        for task in self._tasks:
+            task.cancel()
+        self._key = None
+        self._future = None
+
+    @callback
+    def _flush(self) -> None:
+        """Send the repeats of the pending burst."""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        if self._key is None:
+            return
+        key, count, future = self._key, self._count, self._future
+        self._key = None
+        self._future = None
+        if count > 0:
+            self._start_send(key, count, future)
+
+    @callback
+    def _start_send(
+        self, key: str, count: int, future: asyncio.Future | None = None
+    ) -> asyncio.Task:
+        """Start the task that send the key, keeping the order of the sends."""
+        task = self._hass.async_create_task(self._async_send(key, count, future))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _async_send(
+        self, key: str, count: int, future: asyncio.Future | None
+    ) -> bool:
+        """Send the key repeated and set the result of waiting callers."""
+        if count > 1:
+            _LOGGER.debug("Sending key %s coalesced %s times", key, count)
+        try:
+            async with self._send_lock:
+                result = bool(await self._send_method(key, count))
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOGGER.debug("Failed sending key %s: %s", key, exc)
+            result = False
+        if future and not future.done():
+            future.set_result(result)
+        return result
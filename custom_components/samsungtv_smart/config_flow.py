@@ -20,13 +20,15 @@ from homeassistant.const import (
     CONF_MAC,
     CONF_NAME,
     CONF_PORT,
+    CONF_SCAN_INTERVAL,
     CONF_TOKEN,
     __version__,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 
-from . import SamsungTVInfo, get_device_info, is_valid_ha_version
+from . import SamsungTVInfo, is_valid_ha_version, parse_device_info
+from .api.discovery import async_discover_tvs, get_local_network
 from .const import (
     ATTR_DEVICE_MAC,
     ATTR_DEVICE_MODEL,
@@ -54,8 +56,11 @@ from .const import (
     CONF_WOL_REPEAT,
     CONF_WS_NAME,
     DEFAULT_POWER_ON_DELAY,
+    DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MAX_SCAN_INTERVAL,
     MAX_WOL_REPEAT,
+    MIN_SCAN_INTERVAL,
     RESULT_ST_DEVICE_NOT_FOUND,
     RESULT_ST_DEVICE_USED,
     RESULT_SUCCESS,
@@ -95,6 +100,8 @@ POWER_ON_METHODS = {
     PowerOnMethod.SmartThings.value: "SmartThings (better for wireless connection)",
 }
 
+CONF_DISCOVERED_TV = "discovered_tv"
+CONF_NETWORK = "network"
 CONF_SHOW_ADV_OPT = "show_adv_opt"
 CONF_ST_DEVICE = "st_devices"
 CONF_USE_HA_NAME = "use_ha_name_for_ws"
@@ -107,6 +114,7 @@ ADVANCED_OPTIONS = [
     CONF_PING_PORT,
     CONF_WOL_REPEAT,
     CONF_POWER_ON_DELAY,
+    CONF_SCAN_INTERVAL,
     CONF_TOGGLE_ART_MODE,
     CONF_USE_MUTE_CHECK,
 ]
@@ -135,6 +143,9 @@ class SamsungTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize flow."""
         self._user_data = None
         self._st_devices_schema = None
+        self._network = None
+        self._discovered_schema = None
+        self._discovered_tvs = {}
 
         self._tv_info: SamsungTVInfo | None = None
         self._host = None
@@ -210,7 +221,7 @@ class SamsungTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if result == RESULT_SUCCESS:
             self._token = self._tv_info.ws_token
             self._ping_port = self._tv_info.ping_port
-            self._device_info = await get_device_info(self._host, session)
+            self._device_info = self._tv_info.device_info
 
         return result
 
@@ -238,6 +249,73 @@ class SamsungTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if api_key := self._get_api_key():
                 self._user_data = {CONF_API_KEY: api_key}
 
+        return self.async_show_menu(step_id="user", menu_options=["scan", "manual"])
+
+    def _prepare_discovered_schema(self):
+        """Prepare the schema for select a discovered TV"""
+        validate = {}
+        for host, info in self._discovered_tvs.items():
+            name = info.get(ATTR_DEVICE_NAME, host)
+            if model := info.get(ATTR_DEVICE_MODEL):
+                name += f" - {model}"
+            validate[host] = f"{name} ({host})"
+        return vol.Schema({vol.Required(CONF_DISCOVERED_TV): vol.In(validate)})
+
+    async def async_step_scan(self, user_input=None):
+        """Handle a flow to discover TV on local network."""
+        if user_input is None:
+            if self._network is None:
+                self._network = await self.hass.async_add_executor_job(
+                    get_local_network
+                )
+            return self._show_form(step_id="scan")
+
+        self._network = user_input.get(CONF_NETWORK)
+        configured_hosts = [
+            entry.data[CONF_HOST]
+            for entry in self._async_current_entries()
+            if CONF_HOST in entry.data
+        ]
+        session = self.hass.helpers.aiohttp_client.async_get_clientsession()
+        try:
+            discovered = await async_discover_tvs(
+                self._network, session, exclude=configured_hosts
+            )
+        except ValueError:
+            return self._show_form(errors="invalid_network", step_id="scan")
+
+        configured_ids = self._async_current_ids()
+        self._discovered_tvs = {}
+        for host, info in discovered.items():
+            device_info = parse_device_info(info)
+            if device_info.get(ATTR_DEVICE_ID) in configured_ids:
+                continue
+            if device_info.get(ATTR_DEVICE_MAC) in configured_ids:
+                continue
+            self._discovered_tvs[host] = device_info
+
+        if not self._discovered_tvs:
+            return self._show_form(errors="no_devices_found", step_id="scan")
+
+        self._discovered_schema = self._prepare_discovered_schema()
+        return await self.async_step_discovered()
+
+    async def async_step_discovered(self, user_input=None):
+        """Handle a flow to select a discovered TV."""
+        if user_input is None:
+            return self._show_form(step_id="discovered")
+
+        host = user_input[CONF_DISCOVERED_TV]
+        device_info = self._discovered_tvs.get(host, {})
+        self._user_data = {
+            **(self._user_data or {}),
+            CONF_HOST: host,
+            CONF_NAME: device_info.get(ATTR_DEVICE_NAME, ""),
+        }
+        return await self.async_step_manual()
+
+    async def async_step_manual(self, user_input=None):
+        """Handle a flow to manual input TV information."""
         if user_input is None:
             return self._show_form()
 
@@ -311,7 +389,7 @@ class SamsungTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return await self.async_step_stdeviceid()
             if is_user_step:
                 return self._show_form()
-            return await self.async_step_user()
+            return await self.async_step_manual()
 
         updates = {}
         if mac := self._device_info.get(ATTR_DEVICE_MAC):
@@ -387,7 +465,7 @@ class SamsungTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return init_schema
 
     @callback
-    def _show_form(self, errors: str | None = None, step_id="user"):
+    def _show_form(self, errors: str | None = None, step_id="manual"):
         """Show the form to the user."""
         base_err = errors or self._error
         self._error = None
@@ -396,6 +474,17 @@ class SamsungTVConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema = self._st_devices_schema
         elif step_id == "stdeviceid":
             data_schema = vol.Schema({vol.Required(CONF_DEVICE_ID): str})
+        elif step_id == "scan":
+            data_schema = vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_NETWORK,
+                        description={"suggested_value": self._network or ""},
+                    ): str
+                }
+            )
+        elif step_id == "discovered":
+            data_schema = self._discovered_schema
         else:
             data_schema = self._get_init_schema()
 
@@ -537,6 +626,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 CONF_POWER_ON_DELAY,
                 default=options.get(CONF_POWER_ON_DELAY, DEFAULT_POWER_ON_DELAY),
             ): vol.All(vol.Coerce(int), vol.Clamp(min=0, max=60)),
+            vol.Required(
+                CONF_SCAN_INTERVAL,
+                default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            ): vol.All(
+                vol.Coerce(int),
+                vol.Clamp(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
+            ),
             vol.Required(
                 CONF_PING_PORT, default=options.get(CONF_PING_PORT, 0)
             ): vol.All(vol.Coerce(int), vol.Clamp(min=0, max=65535)),
@@ -26,7 +26,10 @@ MIN_HA_MIN_VER = 10
 __min_ha_version__ = f"{MIN_HA_MAJ_VER}.{MIN_HA_MIN_VER}.0"
 
 DATA_CFG_YAML = "cfg_yaml"
+DATA_MEDIA_PLAYER = "media_player"
 DATA_OPTIONS = "options"
+DATA_SCHEDULER = "scheduler"
+DATA_WOL = "wol"
 LOCAL_LOGO_PATH = "local_logo_path"
 WS_PREFIX = "[Home Assistant]"
 
@@ -34,6 +37,7 @@ ATTR_DEVICE_MAC = "device_mac"
 ATTR_DEVICE_MODEL = "device_model"
 ATTR_DEVICE_NAME = "device_name"
 ATTR_DEVICE_OS = "device_os"
+ATTR_DEVICE_TOKEN_AUTH = "device_token_auth"
 
 CONF_APP_LAUNCH_METHOD = "app_launch_method"
 CONF_APP_LIST = "app_list"
@@ -47,6 +51,7 @@ CONF_EXT_POWER_ENTITY = "ext_power_entity"
 CONF_LOAD_ALL_APPS = "load_all_apps"
 CONF_LOGO_OPTION = "logo_option"
 CONF_PING_PORT = "ping_port"
+CONF_KEY_PRESS_DELAY = "key_press_delay"
 CONF_POWER_ON_DELAY = "power_on_delay"
 CONF_POWER_ON_METHOD = "power_on_method"
 CONF_SHOW_CHANNEL_NR = "show_channel_number"
@@ -69,10 +74,15 @@ CONF_SCAN_APP_HTTP = "scan_app_http"
 DEFAULT_APP = "TV/HDMI"
 DEFAULT_PORT = 8001
 DEFAULT_POWER_ON_DELAY = 30
+DEFAULT_SCAN_INTERVAL = 15
 DEFAULT_SOURCE_LIST = {"TV": "KEY_TV", "HDMI": "KEY_HDMI"}
 DEFAULT_TIMEOUT = 6
 
+MAX_SCAN_INTERVAL = 300
 MAX_WOL_REPEAT = 5
+MIN_SCAN_INTERVAL = 5
+
+STORAGE_VERSION = 1
 
 RESULT_NOT_SUCCESSFUL = "not_successful"
 RESULT_NOT_SUPPORTED = "not_supported"
@@ -82,6 +92,8 @@ RESULT_ST_MULTI_DEVICES = "st_multiple_device"
 RESULT_SUCCESS = "success"
 RESULT_WRONG_APIKEY = "wrong_api_key"
 
+SERVICE_BROADCAST = "broadcast"
+SERVICE_CALIBRATE_KEY_DELAY = "calibrate_key_delay"
 SERVICE_SELECT_PICTURE_MODE = "select_picture_mode"
 SERVICE_SET_ART_MODE = "set_art_mode"
 
@@ -7,7 +7,7 @@ from homeassistant.const import CONF_API_KEY, CONF_ID, CONF_MAC, CONF_TOKEN
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 
-from .const import DOMAIN
+from .const import DATA_MEDIA_PLAYER, DOMAIN
 
 TO_REDACT = {CONF_API_KEY, CONF_MAC, CONF_TOKEN}
 
@@ -27,6 +27,10 @@ async def async_get_config_entry_diagnostics(
     if hass_data:
         diag_data["device"] = hass_data
 
+    entry_data = hass.data[DOMAIN].get(entry.entry_id, {})
+    if media_player := entry_data.get(DATA_MEDIA_PLAYER):
+        diag_data["connection"] = media_player.get_connection_diagnostics()
+
     return diag_data
 
 
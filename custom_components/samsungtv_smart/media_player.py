@@ -1,16 +1,19 @@
 """Support for interface with an Samsung TV."""
+from __future__ import annotations
+
 import asyncio
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import partial
 import json
 import logging
-from socket import error as socketError
-from time import sleep
+from typing import Awaitable, Callable
 from urllib.parse import parse_qs, urlparse
 
 from aiohttp import ClientConnectionError, ClientResponseError, ClientSession
 import async_timeout
 import voluptuous as vol
-from wakeonlan import send_magic_packet
 from websocket import WebSocketTimeoutException
 
 from homeassistant.components import media_source
@@ -34,27 +37,47 @@ from homeassistant.const import (
     CONF_MAC,
     CONF_NAME,
     CONF_PORT,
+    CONF_SCAN_INTERVAL,
     CONF_SERVICE,
     CONF_SERVICE_DATA,
     CONF_TIMEOUT,
     CONF_TOKEN,
+    EVENT_HOMEASSISTANT_STOP,
     STATE_OFF,
     STATE_ON,
 )
 from homeassistant.core import DOMAIN as HA_DOMAIN, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
 from homeassistant.helpers.service import CONF_SERVICE_ENTITY_ID, async_call_from_config
-from homeassistant.helpers.storage import STORAGE_DIR
-from homeassistant.util import Throttle, dt as dt_util
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
-from .api.samsungws import ArtModeStatus, SamsungTVWS
-from .api.smartthings import SmartThingsTV, STStatus
+from . import apps_storage_key
+from .api.keyhold import KeyHoldManager
+from .api.pointer import PointerSession
+from .api.rest import PowerState
+from .api.samsungws import (
+    APP_LAUNCH_CONTROL,
+    APP_LAUNCH_METHODS,
+    APP_LAUNCH_REMOTE,
+    APP_LAUNCH_REST,
+    EVENT_TV_UPDATE,
+    SHUTDOWN_TIMEOUT,
+    ArtModeStatus,
+    SamsungTVWS,
+    async_ping_port,
+)
+from .api.smartthings import DIGITAL_TV, SmartThingsTV, STStatus
 from .api.upnp import upnp
+from .api.wol import AsyncWakeOnLan
+from .coalesce import KeyRepeatCoalescer
 from .const import (
     CONF_APP_LAUNCH_METHOD,
     CONF_APP_LIST,
@@ -65,6 +88,7 @@ from .const import (
     CONF_DEVICE_OS,
     CONF_DUMP_APPS,
     CONF_EXT_POWER_ENTITY,
+    CONF_KEY_PRESS_DELAY,
     CONF_LOGO_OPTION,
     CONF_PING_PORT,
     CONF_POWER_ON_DELAY,
@@ -81,26 +105,32 @@ from .const import (
     CONF_WOL_REPEAT,
     CONF_WS_NAME,
     DATA_CFG_YAML,
+    DATA_MEDIA_PLAYER,
     DATA_OPTIONS,
+    DATA_WOL,
     DEFAULT_APP,
     DEFAULT_PORT,
     DEFAULT_POWER_ON_DELAY,
+    DEFAULT_SCAN_INTERVAL,
     DEFAULT_SOURCE_LIST,
     DEFAULT_TIMEOUT,
     DOMAIN,
     LOCAL_LOGO_PATH,
     MAX_WOL_REPEAT,
+    SERVICE_CALIBRATE_KEY_DELAY,
     SERVICE_SELECT_PICTURE_MODE,
     SERVICE_SET_ART_MODE,
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
     STD_APP_LIST,
+    STORAGE_VERSION,
     WS_PREFIX,
     AppLaunchMethod,
     AppLoadMethod,
     PowerOnMethod,
 )
 from .logo import LOGO_OPTION_DEFAULT, LocalImageUrl, Logo, LogoOption
+from .scheduler import AdaptivePollRate, async_get_poll_scheduler
 
 ATTR_ART_MODE_STATUS = "art_mode_status"
 ATTR_IP_ADDRESS = "ip_address"
@@ -114,9 +144,27 @@ CMD_RUN_APP_REST = "run_app_rest"
 CMD_SEND_KEY = "send_key"
 CMD_SEND_TEXT = "send_text"
 
-DELAYED_SOURCE_TIMEOUT = 80
+BOOT_QUEUE_TIMEOUT = 80
+BOOT_WATCH_INTERVAL = 0.3
+SOURCE_CONFIRM_ST_INTERVAL = 1
+SOURCE_CONFIRM_TIMEOUT = 3
 KEYHOLD_MAX_DELAY = 5.0
+CALIBRATION_DELAYS = (0.5, 0.35, 0.25, 0.18, 0.12, 0.08, 0.05)
+CALIBRATION_KEYS = 4
+CALIBRATION_MARGIN = 1.5
+CALIBRATION_SETTLE_TIME = 1.0
 KEYPRESS_DEFAULT_DELAY = 0.5
+# keys merged in a single repeat sequence when pressed in burst
+KEYS_COALESCED = {
+    "KEY_VOLUP",
+    "KEY_VOLDOWN",
+    "KEY_CHUP",
+    "KEY_CHDOWN",
+    "KEY_UP",
+    "KEY_DOWN",
+    "KEY_LEFT",
+    "KEY_RIGHT",
+}
 KEYPRESS_MAX_DELAY = 2.0
 KEYPRESS_MIN_DELAY = 0.2
 MAX_ST_ERROR_COUNT = 4
@@ -124,15 +172,15 @@ MEDIA_TYPE_BROWSER = "browser"
 MEDIA_TYPE_KEY = "send_key"
 MEDIA_TYPE_TEXT = "send_text"
 POWER_OFF_DELAY = 20
-POWER_ON_DELAY = 5
 ST_APP_SEPARATOR = "/"
 ST_UPDATE_TIMEOUT = 5
+VOLUME_SEND_COOLDOWN = 0.3
 
 YT_APP_IDS = ("111299001912", "9Ur5IzDKqV.TizenYouTube")
 
 MAX_CONTROLLED_ENTITY = 4
 
-MIN_TIME_BETWEEN_APP_SCANS = timedelta(seconds=60)
+APP_STORE_SAVE_DELAY = 10
 
 SUPPORT_SAMSUNGTV_SMART = (
     MediaPlayerEntityFeature.PAUSE
@@ -149,11 +197,21 @@ SUPPORT_SAMSUNGTV_SMART = (
     | MediaPlayerEntityFeature.STOP
 )
 
-SCAN_INTERVAL = timedelta(seconds=15)
+
+CONFIG_LISTS = (CONF_SOURCE_LIST, CONF_APP_LIST, CONF_CHANNEL_LIST)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _get_entry_config(data: dict, entry_data: dict) -> dict:
+    """Merge config entry data with additional configuration from yaml."""
+    config = data.copy()
+    for attr, value in entry_data.get(DATA_CFG_YAML, {}).items():
+        if value:
+            config[attr] = value
+    return config
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ) -> None:
@@ -163,21 +221,17 @@ async def async_setup_entry(
     session = hass.helpers.aiohttp_client.async_get_clientsession()
     local_logo_path = hass.data[DOMAIN].get(LOCAL_LOGO_PATH)
 
-    config = entry.data.copy()
-    add_conf = hass.data[DOMAIN][entry.entry_id].get(DATA_CFG_YAML, {})
-    for attr, value in add_conf.items():
-        if value:
-            config[attr] = value
+    config = _get_entry_config(entry.data, hass.data[DOMAIN][entry.entry_id])
 
     hostname = config[CONF_HOST]
     port = config.get(CONF_PORT, DEFAULT_PORT)
     logo_file = hass.config.path(STORAGE_DIR, f"{DOMAIN}_logo_paths")
 
-    def update_token_func(token: str) -> None:
-        """Update config entry with the new token."""
-        hass.config_entries.async_update_entry(
-            entry, data={**entry.data, CONF_TOKEN: token}
-        )
+    def update_entry_func(data: dict) -> None:
+        """Update config entry with new data (token, learned key delay)."""
+        if all(entry.data.get(key) == value for key, value in data.items()):
+            return
+        hass.config_entries.async_update_entry(entry, data={**entry.data, **data})
 
     async_add_entities(
         [
@@ -186,12 +240,12 @@ async def async_setup_entry(
                 config.get(CONF_ID, entry.entry_id),
                 hass.data[DOMAIN][entry.entry_id],
                 session,
-                update_token_func,
+                update_entry_func,
                 logo_file,
                 local_logo_path,
+                Store(hass, STORAGE_VERSION, apps_storage_key(entry.entry_id)),
             )
-        ],
-        True,
+        ]
     )
 
     # register services
@@ -206,6 +260,11 @@ async def async_setup_entry(
         {},
         "async_set_art_mode",
     )
+    platform.async_register_entity_service(
+        SERVICE_CALIBRATE_KEY_DELAY,
+        {},
+        "async_calibrate_key_delay",
+    )
 
     _LOGGER.info(
         "Samsung TV %s:%d added as '%s'",
@@ -215,6 +274,34 @@ async def async_setup_entry(
     )
 
 
+@callback
+def _async_get_wol_sender(hass: HomeAssistant) -> AsyncWakeOnLan:
+    """Return the WOL sender shared by all entities."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (wol_sender := domain_data.get(DATA_WOL)) is None:
+        wol_sender = domain_data[DATA_WOL] = AsyncWakeOnLan()
+
+        @callback
+        def close_wol_sender(_):
+            """Close the WOL socket."""
+            wol_sender.close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, close_wol_sender)
+    return wol_sender
+
+
+def _split_key_hold(payload: str) -> tuple[str, float]:
+    """Return the key code and the hold time in seconds from a key payload."""
+    source_keys = payload.split(",")
+    key_code = source_keys[0]
+    if len(source_keys) < 2:
+        return key_code, 0
+    hold_time = source_keys[1].replace(" ", "")
+    if not hold_time.isdigit():
+        return key_code, 0
+    return key_code, min(int(hold_time) / 1000, KEYHOLD_MAX_DELAY)
+
+
 def _get_default_app_info(app_id):
     """Get information for default app."""
     if not app_id:
@@ -231,7 +318,33 @@ def _get_default_app_info(app_id):
     return None, None, None
 
 
-class SamsungTVDevice(MediaPlayerEntity):
+@dataclass
+class SamsungTVExtraStoredData(ExtraStoredData):
+    """Object to hold extra stored data."""
+
+    state: str | None
+    source_list: dict | None
+    st_data: dict | None
+
+    def as_dict(self) -> dict:
+        """Return a dict representation of the extra data."""
+        return {
+            "state": self.state,
+            "source_list": self.source_list,
+            "st_data": self.st_data,
+        }
+
+    @classmethod
+    def from_dict(cls, restored: dict) -> SamsungTVExtraStoredData:
+        """Initialize a stored state from a dict."""
+        return cls(
+            restored.get("state"),
+            restored.get("source_list"),
+            restored.get("st_data"),
+        )
+
+
+class SamsungTVDevice(MediaPlayerEntity, RestoreEntity):
     """Representation of a Samsung TV."""
 
     def __init__(
@@ -240,14 +353,18 @@ class SamsungTVDevice(MediaPlayerEntity):
         unique_id,
         entry_data,
         session: ClientSession,
-        update_token_func,
+        update_entry_func,
         logo_file,
         local_logo_path,
+        app_store: Store,
     ):
         """Initialize the Samsung device."""
 
         self._entry_data = entry_data
         self._session = session
+        self._update_entry_func = update_entry_func
+        # key delay learned with calibration, None if not calibrated
+        self._learned_key_delay: float | None = None
         self._host = config[CONF_HOST]
         self._mac = config.get(CONF_MAC)
 
@@ -255,6 +372,8 @@ class SamsungTVDevice(MediaPlayerEntity):
         self._attr_name = config.get(CONF_NAME, self._host)
         self._attr_unique_id = unique_id
         self._attr_icon = "mdi:television"
+        # polling is managed by the integration scheduler
+        self._attr_should_poll = False
         self._attr_device_class = MediaPlayerDeviceClass.TV
         self._attr_media_title = None
         self._attr_media_image_url = None
@@ -281,29 +400,12 @@ class SamsungTVDevice(MediaPlayerEntity):
         # Save a reference to the imported config
         self._broadcast = config.get(CONF_BROADCAST_ADDRESS)
 
-        # load sources list
-        self._default_source_used = False
-        source_list = SamsungTVDevice._load_param_list(config.get(CONF_SOURCE_LIST, {}))
-        if not source_list:
-            source_list = DEFAULT_SOURCE_LIST
-            self._default_source_used = True
-        self._source_list = source_list
-
-        # load apps list
+        # load sources, apps and channels lists
         self._dump_apps = True
-        app_list = SamsungTVDevice._load_param_list(config.get(CONF_APP_LIST))
-        if app_list is not None:
-            double_list = SamsungTVDevice._split_app_list(app_list, "/")
-            self._app_list = double_list["app"]
-            self._app_list_ST = double_list["appST"]
-        else:
-            self._app_list = None
-            self._app_list_ST = None
-
-        # load channels list
-        self._channel_list = SamsungTVDevice._load_param_list(
-            config.get(CONF_CHANNEL_LIST)
-        )
+        self._app_store = app_store
+        self._installed_app_hash = None
+        self._config_lists: dict | None = None
+        self._load_config_lists(config)
 
         self._source = None
         self._running_app = None
@@ -316,13 +418,19 @@ class SamsungTVDevice(MediaPlayerEntity):
         self._started_up = False
         self._end_of_power_off = None
         self._power_on_detected = None
-        self._delay_cancel = None
-        self._set_update_forced = 0
-        self._delay_status_update = False
-        self._update_forced_time = None
+        self._poll_rate: AdaptivePollRate | None = None
         self._fake_on = None
-        self._delayed_set_source = None
-        self._delayed_set_source_time = None
+        self._tv_event = asyncio.Event()
+        self._key_coalescer: KeyRepeatCoalescer | None = None
+        self._is_shutdown = False
+        self._ext_entity_unsub: Callable[[], None] | None = None
+        self._volume_debouncer: Debouncer | None = None
+        self._volume_target: float | None = None
+        self._pointer: PointerSession | None = None
+        self._boot_watch_task: asyncio.Task | None = None
+        self._boot_start_time: datetime | None = None
+        self._boot_queue: deque[tuple[Callable[..., Awaitable], tuple]] = deque()
+        self._boot_flush_task: asyncio.Task | None = None
 
         ws_name = config.get(CONF_WS_NAME, self._attr_name)
         ws_port = config.get(CONF_PORT, DEFAULT_PORT)
@@ -336,14 +444,31 @@ class SamsungTVDevice(MediaPlayerEntity):
             key_press_delay=KEYPRESS_DEFAULT_DELAY,
             token=ws_token,
             app_list=self._app_list,
+            session=session,
         )
+        self._set_learned_key_delay(config.get(CONF_KEY_PRESS_DELAY))
+        self._key_hold = KeyHoldManager(self._ws)
 
         def new_token_callback():
             """Update config entry with the new token."""
-            run_callback_threadsafe(self.hass.loop, update_token_func, self._ws.token)
+            run_callback_threadsafe(
+                self.hass.loop, update_entry_func, {CONF_TOKEN: self._ws.token}
+            )
 
         self._ws.register_new_token_callback(new_token_callback)
 
+        def installed_app_callback():
+            """Update installed app list and save it in storage."""
+            run_callback_threadsafe(self.hass.loop, self._installed_app_changed)
+
+        self._ws.register_installed_app_callback(installed_app_callback)
+
+        def event_callback(event, data):
+            """Notify a TV state change received from web socket."""
+            run_callback_threadsafe(self.hass.loop, self._async_tv_event, event, data)
+
+        self._ws.register_event_callback(event_callback)
+
         self._upnp = upnp(host=self._host, session=session)
 
         self._st = None
@@ -383,6 +508,84 @@ class SamsungTVDevice(MediaPlayerEntity):
 
         return dict(dev_info)
 
+    def _load_config_lists(self, config) -> set[str]:
+        """Load sources, apps and channels lists, return the lists changed."""
+        new_lists = {key: config.get(key) for key in CONFIG_LISTS}
+        changed = {
+            key
+            for key, value in new_lists.items()
+            if self._config_lists is None or self._config_lists.get(key) != value
+        }
+        self._config_lists = new_lists
+
+        if CONF_SOURCE_LIST in changed:
+            source_list = SamsungTVDevice._load_param_list(
+                new_lists[CONF_SOURCE_LIST] or {}
+            )
+            self._default_source_used = not source_list
+            self._source_list = source_list or DEFAULT_SOURCE_LIST
+
+        if CONF_APP_LIST in changed:
+            app_list = SamsungTVDevice._load_param_list(new_lists[CONF_APP_LIST])
+            self._app_list_auto = app_list is None
+            if app_list is not None:
+                double_list = SamsungTVDevice._split_app_list(app_list, "/")
+                self._app_list = double_list["app"]
+                self._app_list_ST = double_list["appST"]
+            else:
+                self._app_list = None
+                self._app_list_ST = None
+            self._yt_app_id = None
+
+        if CONF_CHANNEL_LIST in changed:
+            self._channel_list = SamsungTVDevice._load_param_list(
+                new_lists[CONF_CHANNEL_LIST]
+            )
+
+        return changed
+
+    @callback
+    def async_apply_config(self, data: dict) -> None:
+        """Apply changed configuration lists, keeping the connections to the TV."""
+        config = _get_entry_config(data, self._entry_data)
+        if not (changed := self._load_config_lists(config)):
+            return
+        _LOGGER.debug("%s - configuration changed: %s", self.entity_id, changed)
+
+        if CONF_APP_LIST in changed:
+            self._ws.set_app_list(None if self._app_list_auto else self._app_list)
+            if self._app_list_auto:
+                self._installed_app_hash = None
+                self._gen_installed_app_list()
+            self._get_running_app()
+        if CONF_SOURCE_LIST in changed and self._default_source_used and self._st:
+            self._get_st_sources()
+        self.async_write_ha_state()
+
+    @callback
+    def async_apply_options(self, changed: set[str]) -> None:
+        """Apply changed options that are not read on each update."""
+        _LOGGER.debug("%s - options changed: %s", self.entity_id, changed)
+        if CONF_SCAN_INTERVAL in changed and self._poll_rate:
+            scan_interval = self._get_option(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+            self._poll_rate.async_set_base_interval(timedelta(seconds=scan_interval))
+
+        if changed & {CONF_APP_LOAD_METHOD, CONF_DUMP_APPS}:
+            # regenerate the app list from the installed apps already loaded
+            self._dump_apps = True
+            self._installed_app_hash = None
+            self._gen_installed_app_list()
+            self._get_running_app()
+
+        if CONF_EXT_POWER_ENTITY in changed and self._poll_rate:
+            self._async_track_ext_entity()
+
+        if changed & {CONF_LOGO_OPTION, CONF_USE_LOCAL_LOGO} and self._poll_rate:
+            # media image is refreshed by the update
+            self._poll_rate.async_signal()
+
+        self.async_write_ha_state()
+
     @staticmethod
     def _load_param_list(src_list):
         """Load parameters in JSON from configuration.yaml"""
@@ -430,52 +633,6 @@ class SamsungTVDevice(MediaPlayerEntity):
             and self._end_of_power_off > dt_util.utcnow()
         )
 
-    def _update_forced(self):
-        """Check if a forced update is required."""
-        if self._delay_status_update:
-            self._delay_status_update = False
-            return True
-
-        if self._delay_cancel:
-            self._delay_cancel()
-            self._delay_cancel = None
-
-        if self._set_update_forced > 0:
-            self._set_update_forced -= 1
-            self._update_forced_time = datetime.utcnow()
-            self._power_on_detected = datetime.min
-            return False
-
-        if not self._update_forced_time:
-            return False
-
-        call_time = datetime.utcnow()
-        difference = (call_time - self._update_forced_time).total_seconds()
-        if difference >= 10:
-            self._update_forced_time = None
-            return False
-        return True
-
-    def _delay_update(self, delay_sec: int):
-        """Delay the update for a specific interval"""
-        if self._set_update_forced <= 0:
-            return
-
-        if self._state == MediaPlayerState.ON:
-            self._set_update_forced = 0
-            return
-
-        @callback
-        def update_status(_):
-            self._delay_status_update = False
-            if self._state != MediaPlayerState.ON:
-                self.async_schedule_update_ha_state(True)
-            else:
-                self._set_update_forced = 0
-
-        self._delay_status_update = True
-        self._delay_cancel = async_call_later(self.hass, delay_sec, update_status)
-
     def _delay_power_on(self, result):
         """Manage delay for power on status."""
         if result and self._state == MediaPlayerState.OFF:
@@ -522,12 +679,17 @@ class SamsungTVDevice(MediaPlayerEntity):
             return True
         return not self.hass.states.is_state(ext_entity, STATE_OFF)
 
-    def _ping_device(self):
+    def _ping_device(self, rest_power_on=None):
         """Ping TV with WS and others method to check power status."""
 
-        ping_port = self._get_option(CONF_PING_PORT, 0)
-        result = self._ws.ping_device(ping_port)
-        if result and self._st:
+        if rest_power_on is not None:
+            # power state from rest api is reliable, other checks are skipped
+            result = self._ws.ping_device(power_on=rest_power_on)
+        else:
+            ping_port = self._get_option(CONF_PING_PORT, 0)
+            result = self._ws.ping_device(ping_port)
+
+        if result and self._st and rest_power_on is None:
             use_st_status = self._get_option(CONF_USE_ST_STATUS_INFO, True)
             if (
                 self._st.state == STStatus.STATE_OFF
@@ -623,19 +785,26 @@ class SamsungTVDevice(MediaPlayerEntity):
             self._source_list = st_source_list
             self._default_source_used = False
 
-    @Throttle(MIN_TIME_BETWEEN_APP_SCANS)
-    def _gen_installed_app_list(self, **kwargs):
+    @callback
+    def _gen_installed_app_list(self):
         """Get apps installed on TV."""
 
         if self._dump_apps:
             self._dump_apps = self._get_option(CONF_DUMP_APPS, False)
 
-        if not (self._app_list is None or self._dump_apps):
+        if not (self._app_list_auto or self._dump_apps):
             return
 
+        # an empty list is valid, None means apps not loaded yet
+        app_hash = self._ws.installed_app_hash
+        if app_hash is None:
+            return
         app_list = self._ws.installed_app
-        if not app_list:
+
+        # regenerate the list only if installed apps changed
+        if app_hash == self._installed_app_hash and not self._dump_apps:
             return
+        self._installed_app_hash = app_hash
 
         app_load_method = AppLoadMethod(
             self._get_option(CONF_APP_LOAD_METHOD, AppLoadMethod.All.value)
@@ -665,9 +834,10 @@ class SamsungTVDevice(MediaPlayerEntity):
             except Exception:
                 pass
 
-        if self._app_list is None:
+        if self._app_list_auto:
             self._app_list = filtered_app_list
             self._app_list_ST = filtered_app_list_st
+            self._yt_app_id = None
 
         if self._dump_apps:
             _LOGGER.info(
@@ -677,6 +847,22 @@ class SamsungTVDevice(MediaPlayerEntity):
             )
             self._dump_apps = False
 
+    async def _async_load_installed_app(self):
+        """Restore the installed app list saved in storage."""
+        if not (data := await self._app_store.async_load()):
+            return
+        self._ws.restore_installed_app(data.get("apps", []))
+        self._gen_installed_app_list()
+
+    @callback
+    def _installed_app_changed(self):
+        """Manage a change in the list of apps installed on TV."""
+        self._app_store.async_delay_save(
+            lambda: {"apps": self._ws.get_installed_app_data()}, APP_STORE_SAVE_DELAY
+        )
+        self._gen_installed_app_list()
+        self.async_write_ha_state()
+
     def _get_source(self):
         """Return the current input source."""
         if self.state != MediaPlayerState.ON:
@@ -772,12 +958,22 @@ class SamsungTVDevice(MediaPlayerEntity):
     async def async_update(self):
         """Update state of device."""
 
-        if self._update_forced():
-            return
+        # when supported, rest power state replace ping and other checks
+        rest_power_on = None
+        power_state = await self._ws.async_rest_power_state()
+        if power_state != PowerState.Unknown:
+            rest_power_on = power_state == PowerState.On
+            if power_state == PowerState.Standby and (
+                self._ws.artmode_status != ArtModeStatus.Unsupported
+                or self._ws.rest_api.frame_tv_support
+            ):
+                # standby is reported also in art mode, that is detected
+                # with the art channel, so the standard checks are used
+                rest_power_on = None
 
         """Required to get source and media title"""
         st_error = False
-        if self._st:
+        if self._st and rest_power_on is not False:
             use_channel_info = self._get_option(CONF_USE_ST_CHANNEL_INFO, True)
             try:
                 async with async_timeout.timeout(ST_UPDATE_TIMEOUT):
@@ -790,9 +986,11 @@ class SamsungTVDevice(MediaPlayerEntity):
                 st_error = True
                 _LOGGER.debug("%s - SmartThings error: [%s]", self.entity_id, ex)
 
-        result = await self.hass.async_add_executor_job(self._ping_device)
+        result = await self.hass.async_add_executor_job(
+            self._ping_device, rest_power_on
+        )
 
-        if not self._started_up or not result:
+        if not self._started_up or not result or rest_power_on is not None:
             use_mute_check = False
             self._fake_on = None
         else:
@@ -814,6 +1012,9 @@ class SamsungTVDevice(MediaPlayerEntity):
                     result = False
 
         if self._started_up:
+            if self._poll_rate.confirm_power_on:
+                # power on requested by user, power on delay is not used
+                self._power_on_detected = datetime.min
             result = self._delay_power_on(result)
 
         if result and self._st:
@@ -823,32 +1024,27 @@ class SamsungTVDevice(MediaPlayerEntity):
 
         self._state = MediaPlayerState.ON if result else MediaPlayerState.OFF
         self._started_up = True
-        self._delay_update(POWER_ON_DELAY)
+        self._poll_rate.async_state_updated(bool(result))
 
         if (
             self.state == MediaPlayerState.ON
         ):  # NB: We are checking properties, not attribute!
-            if self._delayed_set_source:
-                difference = (
-                    datetime.utcnow() - self._delayed_set_source_time
-                ).total_seconds()
-                if difference > DELAYED_SOURCE_TIMEOUT:
-                    self._delayed_set_source = None
-                else:
-                    await self.async_select_source(self._delayed_set_source, False)
             await self._update_volume_info()
+            self._async_start_boot_flush()
+            await self._ws.async_rest_get_running_app()
             self._get_running_app()
             await self._update_media()
 
         if self._state == MediaPlayerState.OFF:
             self._end_of_power_off = None
 
-    def send_command(
+    def _send_command(
         self,
         payload,
         command_type=CMD_SEND_KEY,
         key_press_delay: float = 0,
         press=False,
+        repeat=1,
     ):
         """Send a key to the tv and handles exceptions."""
         if key_press_delay < 0:
@@ -870,43 +1066,24 @@ class SamsungTVDevice(MediaPlayerEntity):
                 ret_val = self._ws.run_app(
                     app_id, action_type, meta_tag, use_remote=True
                 )
-            elif command_type == CMD_RUN_APP_REST:
-                result = self._ws.rest_app_run(payload)
-                _LOGGER.debug("Rest API result launching app %s: %s", payload, result)
-                ret_val = True
             elif command_type == CMD_OPEN_BROWSER:
                 ret_val = self._ws.open_browser(payload)
             elif command_type == CMD_SEND_TEXT:
                 ret_val = self._ws.send_text(payload)
             elif command_type == CMD_SEND_KEY:
-                hold_delay = 0
-                source_keys = payload.split(",")
-                key_code = source_keys[0]
-                if len(source_keys) > 1:
-
-                    def get_hold_time():
-                        hold_time = source_keys[1].replace(" ", "")
-                        if not hold_time:
-                            return 0
-                        if not hold_time.isdigit():
-                            return 0
-                        hold_time = int(hold_time) / 1000
-                        return min(hold_time, KEYHOLD_MAX_DELAY)
-
-                    hold_delay = get_hold_time()
-
-                if hold_delay > 0:
-                    ret_val = self._ws.hold_key(key_code, hold_delay)
+                # key hold is managed by async_send_command in the event loop
+                if repeat > 1:
+                    ret_val = self._ws.send_keys(payload, repeat, key_press_delay)
                 else:
                     ret_val = self._ws.send_key(
-                        key_code, key_press_delay, "Press" if press else "Click"
+                        payload, key_press_delay, "Press" if press else "Click"
                     )
             else:
                 _LOGGER.debug("Send command: invalid command type -> %s", command_type)
 
         except (ConnectionResetError, AttributeError, BrokenPipeError):
             _LOGGER.debug(
-                "Error in send_command() -> ConnectionResetError/AttributeError/BrokenPipeError"
+                "Error in _send_command() -> ConnectionResetError/AttributeError/BrokenPipeError"
             )
 
         except WebSocketTimeoutException:
@@ -918,7 +1095,7 @@ class SamsungTVDevice(MediaPlayerEntity):
             )
 
         except OSError:
-            _LOGGER.debug("Error in send_command() -> OSError")
+            _LOGGER.debug("Error in _send_command() -> OSError")
 
         return ret_val
 
@@ -928,12 +1105,93 @@ class SamsungTVDevice(MediaPlayerEntity):
         command_type=CMD_SEND_KEY,
         key_press_delay: float = 0,
         press=False,
+        repeat=1,
     ):
         """Send a key to the tv in async mode."""
+        # keys merged by the coalescer must be sent before this command
+        await self._async_flush_keys()
+
+        if command_type == CMD_RUN_APP_REST:
+            result = await self._ws.async_rest_app_run(payload)
+            _LOGGER.debug("Rest API result launching app %s: %s", payload, result)
+            return True
+
+        if command_type == CMD_SEND_KEY:
+            key_code, hold_delay = _split_key_hold(payload)
+            if hold_delay > 0:
+                return await self._key_hold.async_hold(key_code, hold_delay)
+            payload = key_code
+
+        return await self.hass.async_add_executor_job(
+            self._send_command, payload, command_type, key_press_delay, press, repeat
+        )
+
+    async def async_send_text(self, text: str) -> bool:
+        """Send a text to the TV input field."""
+        return await self.async_send_command(text, CMD_SEND_TEXT)
+
+    @callback
+    def async_move_pointer(self, dx: int, dy: int, click=False) -> bool:
+        """Stream a pointer movement to the TV, return False if TV is off."""
+        if self._state != MediaPlayerState.ON:
+            return False
+        if self._pointer is None:
+            self._pointer = PointerSession(self._ws)
+        if dx or dy:
+            self._pointer.move(dx, dy)
+        if click:
+            self._pointer.click()
+        return True
+
+    def _send_key_batch(self, keys: list[str], delay: float) -> bool:
+        """Send a batch of keys and handles exceptions."""
+        try:
+            return self._ws.send_key_sequence(keys, delay)
+        except (ConnectionResetError, AttributeError, BrokenPipeError, OSError):
+            _LOGGER.debug("Error sending keys %s", keys, exc_info=True)
+        except WebSocketTimeoutException:
+            _LOGGER.debug("Timeout sending keys %s", keys, exc_info=True)
+        return False
+
+    async def async_send_key_batch(
+        self, keys: list[str], delay: float, hold: float = 0
+    ) -> bool:
+        """
+        Send a batch of keys paced by delay, used by the remote entity.
+        Keys are sent with a single executor job, or holding each key
+        for the specified time if hold is set.
+        """
+        if hold <= 0:
+            await self._async_flush_keys()
+            return await self.hass.async_add_executor_job(
+                self._send_key_batch, keys, delay
+            )
+
+        await self._async_flush_keys()
+        for index, key in enumerate(keys):
+            if index > 0:
+                await asyncio.sleep(delay)
+            if not await self._key_hold.async_hold(key, min(hold, KEYHOLD_MAX_DELAY)):
+                return False
+        return True
+
+    async def _async_send_key_repeat(self, key: str, count: int) -> bool:
+        """Send a key repeated, used by the key coalescer."""
         return await self.hass.async_add_executor_job(
-            self.send_command, payload, command_type, key_press_delay, press
+            partial(self._send_command, key, repeat=count)
         )
 
+    async def _async_flush_keys(self) -> None:
+        """Wait until the keys merged by the coalescer are sent."""
+        if self._key_coalescer:
+            await self._key_coalescer.async_flush()
+
+    async def _async_press_key(self, key: str) -> bool:
+        """Send a key, merging burst of repeated keys."""
+        if key not in KEYS_COALESCED or self._key_coalescer is None:
+            return await self.async_send_command(key)
+        return await self._key_coalescer.async_press(key)
+
     async def _update_media(self):
         """Update media and logo status."""
         logo_option_changed = False
@@ -1083,8 +1341,6 @@ class SamsungTVDevice(MediaPlayerEntity):
         if self._st and self._default_source_used:
             self._get_st_sources()
 
-        self._gen_installed_app_list()
-
         source_list = []
         source_list.extend(list(self._source_list))
         if self._app_list:
@@ -1119,7 +1375,7 @@ class SamsungTVDevice(MediaPlayerEntity):
             return self._st.sound_mode_list or None
         return None
 
-    def _send_wol_packet(self, wol_repeat=None):
+    async def _async_send_wol_packet(self, wol_repeat=None):
         """Send a WOL packet to turn on the TV."""
         if not self._mac:
             _LOGGER.error("MAC address not configured, impossible send WOL packet")
@@ -1128,25 +1384,9 @@ class SamsungTVDevice(MediaPlayerEntity):
         if not wol_repeat:
             wol_repeat = self._get_option(CONF_WOL_REPEAT, 1)
         wol_repeat = max(1, min(wol_repeat, MAX_WOL_REPEAT))
-        ip_address = self._broadcast or "255.255.255.255"
-        send_success = False
-        for i in range(wol_repeat):
-            if i > 0:
-                sleep(0.25)
-            try:
-                send_magic_packet(self._mac, ip_address=ip_address)
-                send_success = True
-            except socketError as exc:
-                _LOGGER.warning(
-                    "Failed tentative n.%s to send WOL packet: %s",
-                    i,
-                    exc,
-                )
-            except (TypeError, ValueError) as exc:
-                _LOGGER.error("Error sending WOL packet: %s", exc)
-                return False
-
-        return send_success
+        return await _async_get_wol_sender(self.hass).async_send(
+            self._mac, self._broadcast, wol_repeat
+        )
 
     async def _async_power_on(self, set_art_mode=False):
         """Turn the media player on."""
@@ -1178,7 +1418,7 @@ class SamsungTVDevice(MediaPlayerEntity):
             if turn_on_method == PowerOnMethod.SmartThings and self._st:
                 await self._st.async_turn_on()
             else:
-                result = await self.hass.async_add_executor_job(self._send_wol_packet)
+                result = await self._async_send_wol_packet()
 
         if result:
             self._state = MediaPlayerState.OFF
@@ -1187,18 +1427,107 @@ class SamsungTVDevice(MediaPlayerEntity):
 
         return result
 
+    def _boot_in_progress(self):
+        """Check if TV is booting after a power on request."""
+        if self._boot_start_time is None:
+            return False
+        difference = (datetime.utcnow() - self._boot_start_time).total_seconds()
+        return difference <= BOOT_QUEUE_TIMEOUT
+
+    @callback
+    def _async_queue_boot_command(self, method: Callable[..., Awaitable], *args):
+        """
+        Queue a command issued while TV is booting, it will be executed
+        as soon as TV is on. Return False if TV is not booting.
+        """
+        if self.state == MediaPlayerState.ON or not self._boot_in_progress():
+            return False
+        _LOGGER.debug("%s - TV booting, queued command %s", self.entity_id, method)
+        self._boot_queue.append((method, args))
+        return True
+
+    @callback
+    def _async_start_boot_flush(self):
+        """
+        Start executing the commands queued while TV was booting.
+        Commands are executed in a separate task, so the update that detect
+        the TV on is not delayed by app launch and source change.
+        """
+        if self._boot_flush_task and not self._boot_flush_task.done():
+            return
+        if not self._boot_queue:
+            self._boot_start_time = None
+            return
+        if not self._boot_in_progress():
+            _LOGGER.debug("%s - Queued commands expired", self.entity_id)
+            self._boot_queue.clear()
+            self._boot_start_time = None
+            return
+        if self._st and self._st.state != STStatus.STATE_ON:
+            # wait for smartthings available
+            return
+
+        self._boot_start_time = None
+        self._boot_flush_task = self.hass.async_create_task(
+            self._async_flush_boot_queue()
+        )
+
+    @callback
+    def _async_stop_boot_flush(self):
+        """Stop executing the commands queued while TV was booting."""
+        if self._boot_flush_task and not self._boot_flush_task.done():
+            self._boot_flush_task.cancel()
+        self._boot_flush_task = None
+        self._boot_queue.clear()
+
+    async def _async_flush_boot_queue(self):
+        """Execute in order the commands queued while TV was booting."""
+        while self._boot_queue:
+            method, args = self._boot_queue.popleft()
+            try:
+                await method(*args)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "%s - Error executing queued command %s", self.entity_id, method
+                )
+
+    @callback
+    def _async_start_boot_watch(self):
+        """Start watching the TV boot to connect as soon as it is available."""
+        self._async_stop_boot_watch()
+        self._boot_watch_task = self.hass.async_create_task(self._async_boot_watch())
+
+    @callback
+    def _async_stop_boot_watch(self):
+        """Stop watching the TV boot."""
+        if self._boot_watch_task and not self._boot_watch_task.done():
+            self._boot_watch_task.cancel()
+        self._boot_watch_task = None
+
+    async def _async_boot_watch(self):
+        """Probe the TV until it answer and then open the web socket."""
+        while self._boot_in_progress():
+            if await async_ping_port(self._host, DEFAULT_PORT, timeout=1):
+                _LOGGER.debug("%s - TV answered during boot", self.entity_id)
+                await self.hass.async_add_executor_job(
+                    partial(self._ws.start_client, force=True)
+                )
+                self._poll_rate.async_signal()
+                return
+            await asyncio.sleep(BOOT_WATCH_INTERVAL)
+
     async def _async_turn_on(self, set_art_mode=False):
         """Turn the media player on."""
-        self._delayed_set_source = None
+        self._boot_queue.clear()
         if not await self._async_power_on(set_art_mode):
             return False
         if self._state != MediaPlayerState.OFF:
             return True
 
-        self._set_update_forced = (
-            2  # we try to check status 2 times in a shorter interval
-        )
-        self._delay_update(POWER_ON_DELAY)
+        # poll fast until power on is confirmed
+        self._poll_rate.async_confirm(True)
+        self._boot_start_time = datetime.utcnow()
+        self._async_start_boot_watch()
         await self._async_switch_entity(not set_art_mode)
 
         return True
@@ -1211,7 +1540,7 @@ class SamsungTVDevice(MediaPlayerEntity):
         """Turn the media player on setting in art mode."""
         await self._async_turn_on(True)
 
-    def _turn_off(self):
+    async def _async_turn_off(self):
         """Turn off media player."""
         if self._power_off_in_progress():
             return False
@@ -1221,11 +1550,11 @@ class SamsungTVDevice(MediaPlayerEntity):
         self._ws.set_power_off_request()
         if self._state == MediaPlayerState.ON:
             if self._ws.artmode_status == ArtModeStatus.Unsupported:
-                self.send_command(cmd_power_off)
+                await self.async_send_command(cmd_power_off)
             else:
-                self.send_command(f"{cmd_power_art},3000")
+                await self.async_send_command(f"{cmd_power_art},3000")
         elif self._ws.artmode_status == ArtModeStatus.On:
-            self.send_command(f"{cmd_power_art},3000")
+            await self.async_send_command(f"{cmd_power_art},3000")
         else:
             return False
 
@@ -1235,8 +1564,9 @@ class SamsungTVDevice(MediaPlayerEntity):
 
     async def async_turn_off(self):
         """Turn the media player on."""
-        result = await self.hass.async_add_executor_job(self._turn_off)
+        result = await self._async_turn_off()
         if result:
+            self._poll_rate.async_confirm(False)
             await self._async_switch_entity(False)
 
     async def async_toggle(self):
@@ -1254,7 +1584,7 @@ class SamsungTVDevice(MediaPlayerEntity):
         """Volume up the media player."""
         if self._state != MediaPlayerState.ON:
             return
-        await self.async_send_command("KEY_VOLUP")
+        await self._async_press_key("KEY_VOLUP")
         if self.volume_level is not None:
             self._attr_volume_level = min(1.0, self.volume_level + 0.01)
 
@@ -1262,12 +1592,14 @@ class SamsungTVDevice(MediaPlayerEntity):
         """Volume down media player."""
         if self._state != MediaPlayerState.ON:
             return
-        await self.async_send_command("KEY_VOLDOWN")
+        await self._async_press_key("KEY_VOLDOWN")
         if self.volume_level is not None:
             self._attr_volume_level = max(0.0, self.volume_level - 0.01)
 
     async def async_mute_volume(self, mute):
         """Send mute command."""
+        if self._async_queue_boot_command(self.async_mute_volume, mute):
+            return
         if self._state != MediaPlayerState.ON:
             return
         if self.is_volume_muted is not None and mute == self.is_volume_muted:
@@ -1278,51 +1610,69 @@ class SamsungTVDevice(MediaPlayerEntity):
 
     async def async_set_volume_level(self, volume):
         """Set the volume level."""
+        if self._async_queue_boot_command(self.async_set_volume_level, volume):
+            return
         if self._state != MediaPlayerState.ON:
             return
         if self.volume_level is None:
             return
+        # only the latest value is sent when slider updates arrive in burst
+        self._volume_target = volume
+        self._attr_volume_level = volume
+        if self._volume_debouncer is None:
+            await self._async_send_volume()
+            return
+        await self._volume_debouncer.async_call()
+
+    async def _async_send_volume(self):
+        """Send the latest requested volume level."""
+        if (volume := self._volume_target) is None:
+            return
+        self._volume_target = None
         if self._st and self._setvolumebyst:
             await self._st.async_send_command("setvolume", int(volume * 100))
         else:
             await self._upnp.async_set_volume(int(volume * 100))
-        self._attr_volume_level = volume
 
-    def media_play_pause(self):
+    async def async_media_play_pause(self):
         """Simulate play pause media player."""
         if self._playing:
-            self.media_pause()
+            await self.async_media_pause()
         else:
-            self.media_play()
+            await self.async_media_play()
 
-    def media_play(self):
+    async def async_media_play(self):
         """Send play command."""
         self._playing = True
-        self.send_command("KEY_PLAY")
+        await self.async_send_command("KEY_PLAY")
 
-    def media_pause(self):
+    async def async_media_pause(self):
         """Send media pause command to media player."""
         self._playing = False
-        self.send_command("KEY_PAUSE")
+        await self.async_send_command("KEY_PAUSE")
 
-    def media_stop(self):
+    async def async_media_stop(self):
         """Send media pause command to media player."""
         self._playing = False
-        self.send_command("KEY_STOP")
+        await self.async_send_command("KEY_STOP")
 
-    def media_next_track(self):
+    async def async_media_next_track(self):
         """Send next track command."""
         if self.media_channel:
-            self.send_command("KEY_CHUP")
+            await self.async_send_command("KEY_CHUP")
         else:
-            self.send_command("KEY_FF")
+            await self.async_send_command("KEY_FF")
 
-    def media_previous_track(self):
+    async def async_media_previous_track(self):
         """Send the previous track command."""
         if self.media_channel:
-            self.send_command("KEY_CHDOWN")
+            await self.async_send_command("KEY_CHDOWN")
         else:
-            self.send_command("KEY_REWIND")
+            await self.async_send_command("KEY_REWIND")
+
+    async def async_send_keys(self, source_key) -> bool:
+        """Send key / chained keys, return False if failed."""
+        return await self._async_send_keys(source_key)
 
     async def _async_send_keys(self, source_key):
         """Send key / chained keys."""
@@ -1335,14 +1685,14 @@ class SamsungTVDevice(MediaPlayerEntity):
                     prev_wait = True
                     await asyncio.sleep(
                         min(
-                            max((int(this_key) / 1000), KEYPRESS_MIN_DELAY),
+                            max((int(this_key) / 1000), self._min_key_delay),
                             KEYPRESS_MAX_DELAY,
                         )
                     )
                 else:
                     # put a default delay between key if set explicit
                     if not prev_wait:
-                        await asyncio.sleep(KEYPRESS_DEFAULT_DELAY)
+                        await asyncio.sleep(self._key_press_delay)
                     prev_wait = False
                     if this_key.startswith("ST_"):
                         await self._smartthings_keys(this_key)
@@ -1354,7 +1704,7 @@ class SamsungTVDevice(MediaPlayerEntity):
         if source_key.startswith("ST_"):
             return await self._smartthings_keys(source_key)
 
-        return await self.async_send_command(source_key)
+        return await self._async_press_key(source_key)
 
     async def _async_set_channel_source(self, channel_source=None):
         """Select the source for a channel."""
@@ -1372,14 +1722,63 @@ class SamsungTVDevice(MediaPlayerEntity):
             _LOGGER.error("Invalid channel source: %s", channel_source)
             return False
 
+        tv_event = self._tv_event
         await self.async_select_source(channel_source)
         if self._source != channel_source:
             _LOGGER.error("Error selecting channel source: %s", channel_source)
             return False
-        await asyncio.sleep(3)
+        if not await self._async_wait_for_source(channel_source, tv_event):
+            _LOGGER.debug(
+                "%s - Source %s not confirmed by TV", self.entity_id, channel_source
+            )
 
         return True
 
+    @callback
+    def _async_tv_event(self, event: str, data=None):
+        """Wake up the tasks waiting for a TV source change."""
+        _LOGGER.debug("%s - Received TV event %s: %s", self.entity_id, event, data)
+        # only TV update events report a change of source or input,
+        # other events (e.g. app changed) do not confirm the source
+        if event != EVENT_TV_UPDATE:
+            return
+        self._tv_event.set()
+        self._tv_event = asyncio.Event()
+
+    async def _async_wait_for_source(
+        self, source, tv_event: asyncio.Event, timeout=SOURCE_CONFIRM_TIMEOUT
+    ):
+        """
+        Wait until the TV confirm the selected source using web socket events
+        and, if available, SmartThings status. Return False on timeout.
+        """
+        st_source = None
+        if self._st and self._st.state == STStatus.STATE_ON:
+            source_key = self._source_list.get(source, "")
+            if source_key.startswith("ST_"):
+                st_source = source_key[len("ST_") :]
+                if st_source == "TV":
+                    st_source = DIGITAL_TV
+
+        loop = self.hass.loop
+        deadline = loop.time() + timeout
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                await asyncio.wait_for(
+                    tv_event.wait(), min(remaining, SOURCE_CONFIRM_ST_INTERVAL)
+                )
+            except asyncio.TimeoutError:
+                if not st_source:
+                    continue
+            else:
+                if not st_source:
+                    return True
+                tv_event = self._tv_event
+            if await self._st.async_get_input_source() == st_source:
+                return True
+
+        return False
+
     async def _async_set_channel(self, channel):
         """Set a specific channel."""
 
@@ -1405,45 +1804,61 @@ class SamsungTVDevice(MediaPlayerEntity):
         if self._st:
             return await self._smartthings_keys(f"ST_CH{channel_no}")
 
-        def send_digit():
-            for digit in channel_no:
-                self.send_command("KEY_" + digit)
-                sleep(KEYPRESS_DEFAULT_DELAY)
-            self.send_command("KEY_ENTER")
-
-        await self.hass.async_add_executor_job(send_digit)
+        for digit in channel_no:
+            await self.async_send_command("KEY_" + digit)
+            await asyncio.sleep(self._key_press_delay)
+        await self.async_send_command("KEY_ENTER")
         return True
 
-    async def _async_launch_app(self, app_data, meta_data=None):
-        """Launch app with different methods."""
+    async def _async_launch_app_id(self, app_id, methods, meta_tag=""):
+        """Launch app waiting for confirmation and handles exceptions."""
+        try:
+            return await self._ws.async_launch_app(app_id, methods, meta_tag=meta_tag)
+        except (ConnectionResetError, AttributeError, BrokenPipeError, OSError):
+            _LOGGER.debug("Error launching app %s", app_id, exc_info=True)
+        except WebSocketTimeoutException:
+            _LOGGER.debug("Timeout launching app %s", app_id, exc_info=True)
+        return None
 
-        method = ""
+    async def _async_launch_app(self, app_data, meta_data=None):
+        """
+        Launch app with different methods, waiting for the TV to confirm it.
+        Configured method is used first until launch statistics are available,
+        then methods are sorted by measured latency, with failing methods last.
+        """
+        launch_methods = {
+            CMD_RUN_APP: APP_LAUNCH_CONTROL,
+            CMD_RUN_APP_REMOTE: APP_LAUNCH_REMOTE,
+            CMD_RUN_APP_REST: APP_LAUNCH_REST,
+        }
+
+        methods = []
         app_cmd = app_data.split("@")
         app_id = app_cmd[0]
         if self._app_list:
             if app_id_from_list := self._app_list.get(app_id):
                 app_id = app_id_from_list
         if meta_data:
-            app_id += f",,{meta_data}"
-            method = CMD_RUN_APP_REMOTE
+            methods = [APP_LAUNCH_REMOTE]
         elif len(app_cmd) > 1:
             req_method = app_cmd[1].strip()
-            if req_method in (CMD_RUN_APP, CMD_RUN_APP_REMOTE, CMD_RUN_APP_REST):
-                method = req_method
+            if req_method in launch_methods:
+                methods = [launch_methods[req_method]]
 
-        if not method:
+        if not methods:
             app_launch_method = AppLaunchMethod(
                 self._get_option(CONF_APP_LAUNCH_METHOD, AppLaunchMethod.Standard.value)
             )
 
             if app_launch_method == AppLaunchMethod.Remote:
-                method = CMD_RUN_APP_REMOTE
+                method = APP_LAUNCH_REMOTE
             elif app_launch_method == AppLaunchMethod.Rest:
-                method = CMD_RUN_APP_REST
+                method = APP_LAUNCH_REST
             else:
-                method = CMD_RUN_APP
+                method = APP_LAUNCH_CONTROL
+            methods = [method] + [m for m in APP_LAUNCH_METHODS if m != method]
 
-        await self.async_send_command(app_id, method)
+        return await self._async_launch_app_id(app_id, methods, meta_data or "")
 
     def _get_youtube_app_id(self):
         """Search youtube app id used to launch video."""
@@ -1507,6 +1922,8 @@ class SamsungTVDevice(MediaPlayerEntity):
 
         # Launch an app
         elif media_type == MediaType.APP:
+            if self._async_queue_boot_command(self._async_launch_app, media_id):
+                return
             await self._async_launch_app(media_id)
 
         # Send custom key
@@ -1550,22 +1967,23 @@ class SamsungTVDevice(MediaPlayerEntity):
         """Implement the websocket media browsing helper."""
         return await media_source.async_browse_media(self.hass, media_content_id)
 
-    async def async_select_source(self, source, reset_delayed=True):
+    async def async_select_source(self, source):
         """Select input source."""
-        if not reset_delayed:
-            if self._st:
-                if self._st.state != STStatus.STATE_ON:
-                    # wait for smartthings available
-                    return
+        if self.state != MediaPlayerState.ON:
+            if self._async_queue_boot_command(self._async_select_source, source):
+                return
+            if not await self._async_turn_on():
+                return
+            if self._async_queue_boot_command(self._async_select_source, source):
+                return
+            # TV was not off (e.g. in art mode), so there is no boot to wait
+            _LOGGER.debug("%s - TV not booting, source sent now", self.entity_id)
 
-        running_app = DEFAULT_APP
-        self._delayed_set_source = None
+        await self._async_select_source(source)
 
-        if self.state != MediaPlayerState.ON:
-            if await self._async_turn_on():
-                self._delayed_set_source = source
-                self._delayed_set_source_time = datetime.utcnow()
-            return
+    async def _async_select_source(self, source):
+        """Send the command to select input source."""
+        running_app = DEFAULT_APP
 
         if self._source_list and source in self._source_list:
             source_key = self._source_list[source]
@@ -1594,12 +2012,107 @@ class SamsungTVDevice(MediaPlayerEntity):
             raise NotImplementedError()
         await self._st.async_set_sound_mode(sound_mode)
 
+    @property
+    def _key_press_delay(self) -> float:
+        """Return the delay used between keys."""
+        return self._learned_key_delay or KEYPRESS_DEFAULT_DELAY
+
+    @property
+    def _min_key_delay(self) -> float:
+        """Return the minimum delay accepted for explicit waits between keys."""
+        if self._learned_key_delay:
+            return max(self._learned_key_delay, KEYPRESS_MIN_DELAY)
+        return KEYPRESS_MIN_DELAY
+
+    @callback
+    def _set_learned_key_delay(self, key_delay: float | None) -> None:
+        """Apply the key delay learned with calibration."""
+        self._learned_key_delay = key_delay
+        self._ws.key_press_delay = self._key_press_delay
+        if key_delay:
+            self._ws.key_repeat_delay = key_delay
+
+    def _send_calibration_keys(self, key: str, delay: float) -> bool:
+        """Send calibration keys spaced by the specified delay."""
+        for _ in range(CALIBRATION_KEYS):
+            if not self._ws.send_key(key, delay):
+                return False
+        return True
+
+    async def _async_calibration_step(self, key: str, delay: float) -> bool:
+        """Return True if all keys sent with the specified delay are processed."""
+        if (start_volume := await self._upnp.async_get_volume()) is None:
+            return False
+        try:
+            if not await self.hass.async_add_executor_job(
+                self._send_calibration_keys, key, delay
+            ):
+                return False
+            await asyncio.sleep(CALIBRATION_SETTLE_TIME)
+            end_volume = await self._upnp.async_get_volume()
+        finally:
+            await self._upnp.async_set_volume(start_volume)
+
+        if end_volume is None:
+            return False
+        processed = abs(int(end_volume) - int(start_volume))
+        _LOGGER.debug(
+            "Key delay calibration for %s: delay %ss, processed %s/%s keys",
+            self.entity_id,
+            delay,
+            processed,
+            CALIBRATION_KEYS,
+        )
+        return processed == CALIBRATION_KEYS
+
+    async def async_calibrate_key_delay(self):
+        """
+        Learn the minimum delay between keys processed by the TV.
+        Volume keys are sent with decreasing delay and the volume is read
+        back with UPnP to check that no key was dropped.
+        """
+        if self._state != MediaPlayerState.ON:
+            raise HomeAssistantError("TV must be on to calibrate the key delay")
+        if self.is_volume_muted:
+            raise HomeAssistantError("TV must be unmuted to calibrate the key delay")
+        if (volume := await self._upnp.async_get_volume()) is None:
+            raise HomeAssistantError("TV volume not available, calibration failed")
+
+        # use the key that keep the volume inside the valid range
+        key = "KEY_VOLDOWN" if int(volume) > 100 - CALIBRATION_KEYS else "KEY_VOLUP"
+
+        learned_delay = None
+        for delay in CALIBRATION_DELAYS:
+            if not await self._async_calibration_step(key, delay):
+                break
+            learned_delay = delay
+
+        if learned_delay is None:
+            raise HomeAssistantError(
+                f"TV dropped keys using delay {CALIBRATION_DELAYS[0]}s,"
+                " calibration failed"
+            )
+
+        key_delay = round(
+            min(learned_delay * CALIBRATION_MARGIN, KEYPRESS_MAX_DELAY), 2
+        )
+        _LOGGER.info("Key delay for %s calibrated to %ss", self.entity_id, key_delay)
+        self._set_learned_key_delay(key_delay)
+        self._update_entry_func({CONF_KEY_PRESS_DELAY: key_delay})
+
     async def async_select_picture_mode(self, picture_mode):
         """Select picture mode."""
         if not self._st:
             raise NotImplementedError()
         await self._st.async_set_picture_mode(picture_mode)
 
+    def get_connection_diagnostics(self) -> dict:
+        """Return statistics of the TV connection used by diagnostics."""
+        return {
+            "websocket": self._ws.get_connection_stats(),
+            "app_launch": self._ws.get_launch_stats(),
+        }
+
     @property
     def extra_state_attributes(self):
         """Return the optional state attributes."""
@@ -1617,9 +2130,147 @@ class SamsungTVDevice(MediaPlayerEntity):
 
         return data
 
+    @property
+    def extra_restore_state_data(self) -> SamsungTVExtraStoredData:
+        """Return specific state data to be restored."""
+        return SamsungTVExtraStoredData(
+            self._state,
+            self._source_list if self._st else None,
+            self._st.get_restore_data() if self._st else None,
+        )
+
+    async def _async_restore_state(self):
+        """Restore last known state, used until first update is completed."""
+        if (last_data := await self.async_get_last_extra_data()) is None:
+            return
+
+        data = SamsungTVExtraStoredData.from_dict(last_data.as_dict())
+        if data.state in (MediaPlayerState.ON, MediaPlayerState.OFF):
+            self._state = MediaPlayerState(data.state)
+        if data.source_list and self._default_source_used:
+            # list is reloaded from SmartThings when TV is on
+            self._source_list = data.source_list
+        if data.st_data and self._st:
+            self._st.restore_data(data.st_data)
+
+    async def async_added_to_hass(self):
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+        # used by integration level services
+        self._entry_data[DATA_MEDIA_PLAYER] = self
+        self._key_coalescer = KeyRepeatCoalescer(self.hass, self._async_send_key_repeat)
+        self._volume_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=VOLUME_SEND_COOLDOWN,
+            immediate=True,
+            function=self._async_send_volume,
+        )
+        await self._async_restore_state()
+        await self._async_load_installed_app()
+
+        # first update is not executed when entity is added to not delay startup,
+        # the scheduler distribute the polls of all TVs across the scan interval
+        scan_interval = self._get_option(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        self._poll_rate = AdaptivePollRate(
+            async_get_poll_scheduler(self.hass),
+            self.entity_id,
+            timedelta(seconds=scan_interval),
+        )
+        self.async_on_remove(self._poll_rate.async_start(self._async_scheduled_update))
+
+        @callback
+        def async_status_changed(connected: bool):
+            """Poll immediately when web socket connection status change."""
+            self._poll_rate.async_signal()
+            if not connected:
+                self.hass.async_create_task(self._key_hold.async_release_all())
+
+        def status_callback(connected):
+            """Handle web socket connection status change."""
+            run_callback_threadsafe(self.hass.loop, async_status_changed, connected)
+
+        self._ws.register_status_callback(status_callback)
+
+        async def async_hass_stop(_):
+            """Close connections on shutdown."""
+            await self._async_shutdown()
+
+        self.async_on_remove(
+            self.hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, async_hass_stop)
+        )
+
+        self._async_track_ext_entity()
+        self.async_on_remove(self._async_untrack_ext_entity)
+
+    @callback
+    def _async_track_ext_entity(self) -> None:
+        """Poll immediately when the configured external power entity change."""
+        self._async_untrack_ext_entity()
+        if not (ext_entity := self._get_option(CONF_EXT_POWER_ENTITY)):
+            return
+
+        @callback
+        def ext_entity_changed(_):
+            """Poll immediately when external power entity change."""
+            self._poll_rate.async_signal()
+
+        self._ext_entity_unsub = async_track_state_change_event(
+            self.hass, [ext_entity], ext_entity_changed
+        )
+
+    @callback
+    def _async_untrack_ext_entity(self) -> None:
+        """Stop tracking the external power entity."""
+        if self._ext_entity_unsub:
+            self._ext_entity_unsub()
+            self._ext_entity_unsub = None
+
+    async def _async_scheduled_update(self):
+        """Update the entity state, called by the poll scheduler."""
+        await self.async_update_ha_state(True)
+
     async def async_will_remove_from_hass(self):
         """Run when entity will be removed from hass."""
-        await self.hass.async_add_executor_job(self._ws.stop_client)
+        self._entry_data.pop(DATA_MEDIA_PLAYER, None)
+        await self._async_shutdown()
+
+    async def _async_shutdown(self):
+        """
+        Stop all background jobs and close the connections to the TV.
+        Called both on HA stop and on entity removal, only first call is
+        executed and whole shutdown is limited to SHUTDOWN_TIMEOUT.
+        """
+        if self._is_shutdown:
+            return
+        self._is_shutdown = True
+
+        deadline = self.hass.loop.time() + SHUTDOWN_TIMEOUT
+        self._async_stop_boot_watch()
+        self._async_stop_boot_flush()
+        if self._key_coalescer:
+            self._key_coalescer.async_cancel()
+        if self._volume_debouncer:
+            self._volume_debouncer.async_cancel()
+        try:
+            async with async_timeout.timeout(SHUTDOWN_TIMEOUT):
+                if self._pointer:
+                    await self._pointer.async_close()
+                await self._key_hold.async_release_all()
+        except asyncio.TimeoutError:
+            _LOGGER.warning("%s - timeout releasing keys on shutdown", self.entity_id)
+
+        if leaked := await self.hass.async_add_executor_job(
+            self._ws.shutdown, max(deadline - self.hass.loop.time(), 0)
+        ):
+            _LOGGER.warning(
+                "%s - threads not terminated on shutdown: %s", self.entity_id, leaked
+            )
+        try:
+            async with async_timeout.timeout(max(deadline - self.hass.loop.time(), 0)):
+                await self._upnp.async_disconnect()
+        except asyncio.TimeoutError:
+            _LOGGER.warning("%s - timeout closing UPnP on shutdown", self.entity_id)
 
     async def _async_switch_entity(self, power_on: bool):
         """Switch on/off related configure HA entity."""
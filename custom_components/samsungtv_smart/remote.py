@@ -0,0 +1,96 @@
+"""Support for the remote of a SamsungTV Smart."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+import logging
+from typing import Any
+
+from homeassistant.components.media_player import MediaPlayerState
+from homeassistant.components.remote import (
+    ATTR_DELAY_SECS,
+    ATTR_HOLD_SECS,
+    ATTR_NUM_REPEATS,
+    DEFAULT_DELAY_SECS,
+    DEFAULT_HOLD_SECS,
+    DEFAULT_NUM_REPEATS,
+    RemoteEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import DATA_MEDIA_PLAYER, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the Samsung TV remote from a config entry."""
+    # media player platform is set up before the remote, so the entity is available
+    media_player = hass.data[DOMAIN][entry.entry_id].get(DATA_MEDIA_PLAYER)
+    if media_player is None:
+        _LOGGER.warning("Media player for entry %s not found", entry.title)
+        return
+
+    async_add_entities([SamsungTVRemote(media_player)])
+
+
+class SamsungTVRemote(RemoteEntity):
+    """Representation of the remote of a Samsung TV."""
+
+    def __init__(self, media_player) -> None:
+        """Initialize the remote, sharing the connection of the media player."""
+        self._media_player = media_player
+        self._attr_name = media_player.name
+        self._attr_unique_id = f"{media_player.unique_id}-remote"
+        self._attr_device_info = media_player.device_info
+        self._attr_icon = "mdi:remote-tv"
+        self._attr_should_poll = False
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return self._media_player.available
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if TV is on."""
+        return self._media_player.state == MediaPlayerState.ON
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+
+        @callback
+        def media_player_changed(_):
+            """Update the remote state when the media player state change."""
+            self.async_write_ha_state()
+
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, [self._media_player.entity_id], media_player_changed
+            )
+        )
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the TV on."""
+        await self._media_player.async_turn_on()
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the TV off."""
+        await self._media_player.async_turn_off()
+
+    async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
+        """Send all the keys, repeated, as a single paced batch."""
+        num_repeats = kwargs.get(ATTR_NUM_REPEATS, DEFAULT_NUM_REPEATS)
+        delay_secs = kwargs.get(ATTR_DELAY_SECS, DEFAULT_DELAY_SECS)
+        hold_secs = kwargs.get(ATTR_HOLD_SECS, DEFAULT_HOLD_SECS)
+
+        keys = list(command) * num_repeats
+        if not await self._media_player.async_send_key_batch(
+            keys, delay_secs, hold_secs
+        ):
+            _LOGGER.warning("Failed sending keys %s to %s", keys, self.entity_id)
@@ -0,0 +1,258 @@
+"""Polling scheduler shared by all SamsungTV Smart entities."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import timedelta
+from enum import Enum
+import logging
+import math
+import time
+from typing import Awaitable, Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DATA_SCHEDULER, DOMAIN
+
+BACKOFF_FACTOR = 2
+CONFIRM_INTERVAL = 0.5
+CONFIRM_TIMEOUT = 30
+GOLDEN_RATIO_FRACT = 0.6180339887498949
+MAX_BACKOFF_INTERVAL = 120
+MAX_POLLS_IN_FLIGHT = 4
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollMode(Enum):
+    """Define poll modes used by AdaptivePollRate."""
+
+    Normal = 1
+    Confirm = 2
+    Backoff = 3
+
+
+@dataclass
+class _PollSlot:
+    """Scheduling data for a registered poll."""
+
+    phase: float
+    interval: float
+    update_method: Callable[[], Awaitable[None]]
+    handle: asyncio.TimerHandle | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+
+class FleetPollScheduler:
+    """
+    Distribute the polling of all TVs across the scan interval.
+    Each poll get a phase based on golden ratio sequence so polls remain
+    evenly distributed when TVs are added or removed, and the number
+    of polls executed at the same time is limited.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_in_flight=MAX_POLLS_IN_FLIGHT):
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._limit = asyncio.Semaphore(max_in_flight)
+        self._slots: dict[str, _PollSlot] = {}
+        self._epoch = hass.loop.time()
+        self._next_index = 0
+
+    def _next_phase(self) -> float:
+        """Return the phase, as fraction of the interval, for a new poll."""
+        phase = (self._next_index * GOLDEN_RATIO_FRACT) % 1
+        self._next_index += 1
+        return phase
+
+    def _next_time(self, slot: _PollSlot) -> float:
+        """Return next poll time on the slot grid, based on current interval."""
+        now = self._hass.loop.time()
+        first_time = self._epoch + slot.phase * slot.interval
+        periods = max(math.floor((now - first_time) / slot.interval) + 1, 0)
+        return first_time + periods * slot.interval
+
+    @callback
+    def async_register(
+        self,
+        key: str,
+        interval: timedelta,
+        update_method: Callable[[], Awaitable[None]],
+    ) -> CALLBACK_TYPE:
+        """Register a poll and return a callback to unregister it."""
+        self.async_unregister(key)
+
+        slot = _PollSlot(self._next_phase(), interval.total_seconds(), update_method)
+        self._slots[key] = slot
+        self._schedule_next(key, slot)
+        _LOGGER.debug(
+            "Poll %s registered with interval %ss, first poll in %.1fs",
+            key,
+            slot.interval,
+            slot.handle.when() - self._hass.loop.time(),
+        )
+
+        @callback
+        def unregister():
+            self.async_unregister(key)
+
+        return unregister
+
+    @callback
+    def async_unregister(self, key: str) -> None:
+        """Unregister a poll."""
+        if (slot := self._slots.pop(key, None)) is None:
+            return
+        if slot.handle:
+            slot.handle.cancel()
+        if slot.task and not slot.task.done():
+            slot.task.cancel()
+
+    @callback
+    def async_set_interval(self, key: str, interval: timedelta) -> None:
+        """Change the interval of a registered poll."""
+        if (slot := self._slots.get(key)) is None:
+            return
+        new_interval = interval.total_seconds()
+        if new_interval == slot.interval:
+            return
+        slot.interval = new_interval
+        self._schedule_next(key, slot)
+
+    @callback
+    def async_poll_now(self, key: str) -> None:
+        """Execute a registered poll immediately."""
+        if (slot := self._slots.get(key)) is None:
+            return
+        self._run_poll(key, slot)
+
+    @callback
+    def _schedule_next(self, key: str, slot: _PollSlot) -> None:
+        """Schedule next poll on the slot time grid."""
+        if slot.handle:
+            slot.handle.cancel()
+        slot.handle = self._hass.loop.call_at(
+            self._next_time(slot), self._run_poll, key, slot
+        )
+
+    @callback
+    def _run_poll(self, key: str, slot: _PollSlot) -> None:
+        """Start the poll if previous one is completed."""
+        if self._slots.get(key) is not slot:
+            return
+        if slot.task is None or slot.task.done():
+            slot.task = self._hass.async_create_task(self._async_poll(key, slot))
+        else:
+            _LOGGER.debug("Poll %s skipped, previous poll still running", key)
+        self._schedule_next(key, slot)
+
+    async def _async_poll(self, key: str, slot: _PollSlot) -> None:
+        """Execute the poll limiting the number of polls in flight."""
+        async with self._limit:
+            if self._slots.get(key) is not slot:
+                return
+            try:
+                await slot.update_method()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected error polling %s", key)
+
+
+class AdaptivePollRate:
+    """
+    Manage the poll interval of a TV based on its state.
+    Poll is fast while a power command is confirmed, normal while TV is on
+    and exponentially slower while TV is off or unreachable.
+    """
+
+    def __init__(self, scheduler: FleetPollScheduler, key: str, interval: timedelta):
+        """Initialize the object."""
+        self._scheduler = scheduler
+        self._key = key
+        self._base_interval = interval.total_seconds()
+        self._interval = self._base_interval
+        self._mode = PollMode.Normal
+        self._confirm_power_on: bool | None = None
+        self._confirm_deadline = 0.0
+
+    @property
+    def mode(self) -> PollMode:
+        """Return current poll mode."""
+        return self._mode
+
+    @property
+    def confirm_power_on(self) -> bool | None:
+        """Return the power state to confirm, None if not in confirm mode."""
+        if self._mode != PollMode.Confirm:
+            return None
+        return self._confirm_power_on
+
+    @callback
+    def async_start(
+        self, update_method: Callable[[], Awaitable[None]]
+    ) -> CALLBACK_TYPE:
+        """Register the poll in the scheduler and return the unregister callback."""
+        return self._scheduler.async_register(
+            self._key, timedelta(seconds=self._interval), update_method
+        )
+
+    @callback
+    def _set_interval(self, mode: PollMode, interval: float) -> None:
+        """Set poll mode and interval."""
+        if mode != self._mode or interval != self._interval:
+            _LOGGER.debug(
+                "Poll %s mode changed to %s, interval %ss", self._key, mode, interval
+            )
+        self._mode = mode
+        self._interval = interval
+        self._scheduler.async_set_interval(self._key, timedelta(seconds=interval))
+
+    @callback
+    def async_set_base_interval(self, interval: timedelta) -> None:
+        """Change the poll interval used when TV is on."""
+        self._base_interval = interval.total_seconds()
+        if self._mode == PollMode.Normal:
+            self._set_interval(PollMode.Normal, self._base_interval)
+
+    @callback
+    def async_confirm(self, power_on: bool) -> None:
+        """Poll fast until the expected power state is confirmed."""
+        self._confirm_power_on = power_on
+        self._confirm_deadline = time.monotonic() + CONFIRM_TIMEOUT
+        self._set_interval(PollMode.Confirm, CONFIRM_INTERVAL)
+
+    @callback
+    def async_signal(self) -> None:
+        """Reset the backoff and poll immediately, used on push signals."""
+        if self._mode == PollMode.Backoff:
+            self._set_interval(PollMode.Normal, self._base_interval)
+        self._scheduler.async_poll_now(self._key)
+
+    @callback
+    def async_state_updated(self, power_on: bool) -> None:
+        """Update poll mode and interval based on the detected power state."""
+        if self._mode == PollMode.Confirm:
+            if (
+                power_on != self._confirm_power_on
+                and time.monotonic() < self._confirm_deadline
+            ):
+                return
+            self._confirm_power_on = None
+
+        if power_on:
+            self._set_interval(PollMode.Normal, self._base_interval)
+        elif self._mode == PollMode.Backoff:
+            max_interval = max(MAX_BACKOFF_INTERVAL, self._base_interval)
+            self._set_interval(
+                PollMode.Backoff, min(self._interval * BACKOFF_FACTOR, max_interval)
+            )
+        else:
+            self._set_interval(PollMode.Backoff, self._base_interval)
+
+
+@callback
+def async_get_poll_scheduler(hass: HomeAssistant) -> FleetPollScheduler:
+    """Return the scheduler shared by all entities."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := domain_data.get(DATA_SCHEDULER)) is None:
+        scheduler = domain_data[DATA_SCHEDULER] = FleetPollScheduler(hass)
+    return scheduler
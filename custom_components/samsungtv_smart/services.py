@@ -0,0 +1,174 @@
+"""Integration level services for SamsungTV Smart."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+import voluptuous as vol
+
+from homeassistant.components.media_player import MediaType
+from homeassistant.const import ATTR_COMMAND, ATTR_ENTITY_ID, ENTITY_MATCH_ALL
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+import homeassistant.helpers.config_validation as cv
+
+from .const import DATA_MEDIA_PLAYER, DOMAIN, SERVICE_BROADCAST
+
+try:
+    from homeassistant.core import SupportsResponse
+except ImportError:  # service response not available before HA 2023.7
+    SupportsResponse = None
+
+ATTR_LATENCY = "latency"
+ATTR_MAX_PARALLEL = "max_parallel"
+ATTR_RESULTS = "results"
+ATTR_SUCCESS = "success"
+ATTR_TIMEOUT = "timeout"
+ATTR_VALUE = "value"
+ATTR_ERROR = "error"
+
+BROADCAST_CMD_APP = "app"
+BROADCAST_CMD_KEY = "key"
+BROADCAST_CMD_SOURCE = "source"
+BROADCAST_CMD_TURN_OFF = "turn_off"
+BROADCAST_CMD_TURN_ON = "turn_on"
+BROADCAST_CMD_WITH_VALUE = [BROADCAST_CMD_APP, BROADCAST_CMD_KEY, BROADCAST_CMD_SOURCE]
+
+DEFAULT_MAX_PARALLEL = 8
+DEFAULT_BROADCAST_TIMEOUT = 10
+
+EVENT_BROADCAST_RESULT = f"{DOMAIN}_broadcast_result"
+
+
+def _check_value(config):
+    """Check that value is provided for commands that require it."""
+    if config[ATTR_COMMAND] in BROADCAST_CMD_WITH_VALUE and not config.get(ATTR_VALUE):
+        raise vol.Invalid(f"Value is required for command {config[ATTR_COMMAND]}")
+    return config
+
+
+BROADCAST_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_ENTITY_ID): cv.comp_entity_ids,
+            vol.Required(ATTR_COMMAND): vol.In(
+                [
+                    BROADCAST_CMD_APP,
+                    BROADCAST_CMD_KEY,
+                    BROADCAST_CMD_SOURCE,
+                    BROADCAST_CMD_TURN_OFF,
+                    BROADCAST_CMD_TURN_ON,
+                ]
+            ),
+            vol.Optional(ATTR_VALUE): cv.string,
+            vol.Optional(ATTR_MAX_PARALLEL, default=DEFAULT_MAX_PARALLEL): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=64)
+            ),
+            vol.Optional(ATTR_TIMEOUT, default=DEFAULT_BROADCAST_TIMEOUT): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=120)
+            ),
+        }
+    ),
+    _check_value,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_media_players(hass: HomeAssistant) -> dict:
+    """Return the media player entities registered by config entries."""
+    entities = {}
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if not isinstance(entry_data, dict):
+            continue
+        if entity := entry_data.get(DATA_MEDIA_PLAYER):
+            entities[entity.entity_id] = entity
+    return entities
+
+
+def _get_command_job(entity, command: str, value: str | None):
+    """Return the coroutine that execute a broadcast command."""
+    if command == BROADCAST_CMD_APP:
+        return entity.async_play_media(MediaType.APP, value)
+    if command == BROADCAST_CMD_KEY:
+        return entity.async_send_keys(value)
+    if command == BROADCAST_CMD_SOURCE:
+        return entity.async_select_source(value)
+    if command == BROADCAST_CMD_TURN_ON:
+        return entity.async_turn_on()
+    return entity.async_turn_off()
+
+
+async def _async_broadcast(hass: HomeAssistant, call: ServiceCall) -> dict:
+    """Send a command to multiple TVs concurrently."""
+    command = call.data[ATTR_COMMAND]
+    value = call.data.get(ATTR_VALUE)
+    timeout = call.data[ATTR_TIMEOUT]
+    limit = asyncio.Semaphore(call.data[ATTR_MAX_PARALLEL])
+
+    entities = async_get_media_players(hass)
+    target = call.data.get(ATTR_ENTITY_ID)
+    if target and target != ENTITY_MATCH_ALL:
+        not_found = [entity_id for entity_id in target if entity_id not in entities]
+        if not_found:
+            _LOGGER.warning("Broadcast target not found: %s", not_found)
+        entities = {
+            entity_id: entity
+            for entity_id, entity in entities.items()
+            if entity_id in target
+        }
+
+    async def _async_send(entity_id, entity):
+        """Execute the command on a single TV with a deadline."""
+        async with limit:
+            start = time.monotonic()
+            result = {ATTR_ENTITY_ID: entity_id, ATTR_SUCCESS: False}
+            try:
+                success = await asyncio.wait_for(
+                    _get_command_job(entity, command, value), timeout
+                )
+                result[ATTR_SUCCESS] = success is not False
+            except asyncio.TimeoutError:
+                result[ATTR_ERROR] = "timeout"
+            except Exception as exc:  # pylint: disable=broad-except
+                result[ATTR_ERROR] = str(exc) or type(exc).__name__
+            result[ATTR_LATENCY] = round(time.monotonic() - start, 3)
+            return result
+
+    results = await asyncio.gather(
+        *[_async_send(entity_id, entity) for entity_id, entity in entities.items()]
+    )
+    failed = [res[ATTR_ENTITY_ID] for res in results if not res[ATTR_SUCCESS]]
+    _LOGGER.debug(
+        "Broadcast command %s sent to %s TVs, failed: %s", command, len(results), failed
+    )
+
+    report = {ATTR_COMMAND: command, ATTR_RESULTS: list(results)}
+    hass.bus.async_fire(EVENT_BROADCAST_RESULT, report, context=call.context)
+    return report
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration level services."""
+    if hass.services.has_service(DOMAIN, SERVICE_BROADCAST):
+        return
+
+    async def async_broadcast(call: ServiceCall):
+        """Handle broadcast service call."""
+        return await _async_broadcast(hass, call)
+
+    if SupportsResponse is None:
+        hass.services.async_register(
+            DOMAIN, SERVICE_BROADCAST, async_broadcast, schema=BROADCAST_SCHEMA
+        )
+        return
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BROADCAST,
+        async_broadcast,
+        schema=BROADCAST_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,141 @@
+"""Websocket API used by remote control cards to send input to SamsungTV Smart."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+import voluptuous as vol
+
+from homeassistant.auth.permissions.const import POLICY_CONTROL
+from homeassistant.components import websocket_api
+from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import Unauthorized
+
+from .const import DOMAIN
+from .services import async_get_media_players
+
+ATTR_CLICK = "click"
+ATTR_KEY = "key"
+ATTR_LATENCY = "latency"
+ATTR_REPEAT = "repeat"
+ATTR_SUCCESS = "success"
+ATTR_TEXT = "text"
+ATTR_X = "x"
+ATTR_Y = "y"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_send_key)
+    websocket_api.async_register_command(hass, websocket_move_pointer)
+    websocket_api.async_register_command(hass, websocket_send_text)
+
+
+async def _async_handle_input(
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    send_method: Callable[[Any], Awaitable[bool]],
+) -> None:
+    """Send input to the TV and return result with the time spent to send it."""
+    start = time.monotonic()
+    entity_id = msg[ATTR_ENTITY_ID]
+    if not connection.user.permissions.check_entity(entity_id, POLICY_CONTROL):
+        raise Unauthorized(entity_id=entity_id, permission=POLICY_CONTROL)
+
+    entity = async_get_media_players(connection.hass).get(entity_id)
+    if entity is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.const.ERR_NOT_FOUND,
+            f"Entity {entity_id} not found",
+        )
+        return
+    if not entity.available or entity.state == STATE_OFF:
+        connection.send_error(
+            msg["id"],
+            websocket_api.const.ERR_HOME_ASSISTANT_ERROR,
+            f"Entity {entity_id} is not available",
+        )
+        return
+
+    success = await send_method(entity)
+    connection.send_result(
+        msg["id"],
+        {
+            ATTR_SUCCESS: success is not False,
+            ATTR_LATENCY: round(time.monotonic() - start, 3),
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/key",
+        vol.Required(ATTR_ENTITY_ID): str,
+        vol.Required(ATTR_KEY): str,
+        vol.Optional(ATTR_REPEAT, default=1): vol.All(int, vol.Range(min=1, max=20)),
+    }
+)
+@websocket_api.async_response
+async def websocket_send_key(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send a key without the delay used by services."""
+    await _async_handle_input(
+        connection,
+        msg,
+        lambda entity: entity.async_send_command(
+            msg[ATTR_KEY], repeat=msg[ATTR_REPEAT]
+        ),
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/pointer",
+        vol.Required(ATTR_ENTITY_ID): str,
+        vol.Optional(ATTR_X, default=0): int,
+        vol.Optional(ATTR_Y, default=0): int,
+        vol.Optional(ATTR_CLICK, default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def websocket_move_pointer(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream pointer movements and clicks, merged at the pointer frame rate."""
+
+    async def async_move(entity):
+        return entity.async_move_pointer(msg[ATTR_X], msg[ATTR_Y], msg[ATTR_CLICK])
+
+    await _async_handle_input(connection, msg, async_move)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/text",
+        vol.Required(ATTR_ENTITY_ID): str,
+        vol.Required(ATTR_TEXT): str,
+    }
+)
+@websocket_api.async_response
+async def websocket_send_text(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send a text to the TV input field."""
+    await _async_handle_input(
+        connection,
+        msg,
+        lambda entity: entity.async_send_text(msg[ATTR_TEXT]),
+    )
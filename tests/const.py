@@ -0,0 +1,23 @@
+"""Constants used by SamsungTV Smart tests."""
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_ID,
+    CONF_MAC,
+    CONF_NAME,
+    CONF_PORT,
+    CONF_TOKEN,
+)
+
+MOCK_HOST = "192.168.1.100"
+
+
+def mock_entry_data(index: int = 0) -> dict:
+    """Return config entry data for a mocked TV."""
+    return {
+        CONF_HOST: f"192.168.1.{100 + index}",
+        CONF_ID: f"mock-tv-{index}",
+        CONF_MAC: f"aa:bb:cc:dd:ee:{index:02x}",
+        CONF_NAME: f"Mock TV {index}",
+        CONF_PORT: 8002,
+        CONF_TOKEN: "mock-token",
+    }
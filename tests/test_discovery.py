@@ -0,0 +1,133 @@
+"""Test SamsungTV Smart LAN discovery against local responders."""
+import asyncio
+import socket
+from unittest.mock import patch
+
+from aiohttp import web
+import pytest
+
+from homeassistant import config_entries, data_entry_flow
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.samsungtv_smart.api.discovery import async_discover_tvs
+from custom_components.samsungtv_smart.const import DOMAIN
+
+LOCAL_HOST = "127.0.0.1"
+DISCOVERY_TIMEOUT = 0.3
+
+DEVICE_INFO = {
+    "device": {
+        "type": "Samsung SmartTV",
+        "name": "Mock TV",
+        "modelName": "QE55Q80",
+        "wifiMac": "aa:bb:cc:dd:ee:ff",
+        "id": "uuid:mock-tv",
+    }
+}
+
+
+class _SSDPResponder(asyncio.DatagramProtocol):
+    """Reply to SSDP M-SEARCH requests like a TV."""
+
+    def __init__(self):
+        self.requests = []
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.requests.append(data)
+        if data.startswith(b"M-SEARCH"):
+            self.transport.sendto(b"HTTP/1.1 200 OK\r\n\r\n", addr)
+
+
+@pytest.fixture(name="ssdp_responder")
+async def ssdp_responder_fixture(socket_enabled):
+    """Start a local SSDP responder and return it with its port."""
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.create_datagram_endpoint(
+        _SSDPResponder, local_addr=(LOCAL_HOST, 0), family=socket.AF_INET
+    )
+    yield protocol, transport.get_extra_info("sockname")[1]
+    transport.close()
+
+
+@pytest.fixture(name="rest_responder")
+async def rest_responder_fixture(socket_enabled):
+    """Start a local rest api responder and return its port."""
+
+    async def device_info(_):
+        return web.json_response(DEVICE_INFO)
+
+    app = web.Application()
+    app.router.add_get("/api/v2/", device_info)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, LOCAL_HOST, 0)
+    await site.start()
+    yield site._server.sockets[0].getsockname()[1]
+    await runner.cleanup()
+
+
+async def test_discover_ssdp(
+    hass: HomeAssistant, ssdp_responder, rest_responder
+) -> None:
+    """Test TVs that reply to SSDP are discovered."""
+    responder, ssdp_port = ssdp_responder
+    result = await async_discover_tvs(
+        session=async_get_clientsession(hass),
+        timeout=DISCOVERY_TIMEOUT,
+        ssdp_addr=LOCAL_HOST,
+        ssdp_port=ssdp_port,
+        rest_port=rest_responder,
+    )
+    assert result == {LOCAL_HOST: DEVICE_INFO}
+    assert len(responder.requests) == 1
+
+
+async def test_discover_network_scan(hass: HomeAssistant, rest_responder) -> None:
+    """Test TVs found scanning the network, excluding configured hosts."""
+    # ssdp requests are sent to a closed local port and never answered
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind((LOCAL_HOST, 0))
+        closed_port = sock.getsockname()[1]
+
+    kwargs = {
+        "session": async_get_clientsession(hass),
+        "timeout": DISCOVERY_TIMEOUT,
+        "ssdp_addr": LOCAL_HOST,
+        "ssdp_port": closed_port,
+        "scan_ports": [rest_responder],
+        "rest_port": rest_responder,
+    }
+    result = await async_discover_tvs(f"{LOCAL_HOST}/32", **kwargs)
+    assert result == {LOCAL_HOST: DEVICE_INFO}
+
+    result = await async_discover_tvs(
+        f"{LOCAL_HOST}/32", exclude=[LOCAL_HOST], **kwargs
+    )
+    assert result == {}
+
+    with pytest.raises(ValueError):
+        await async_discover_tvs("10.0.0.0/8", **kwargs)
+
+
+async def test_config_flow_scan_step(hass: HomeAssistant) -> None:
+    """Test the scan step is offered by the user menu."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.MENU
+    assert result["menu_options"] == ["scan", "manual"]
+
+    with patch(
+        "custom_components.samsungtv_smart.config_flow.get_local_network",
+        return_value="192.168.1.0/24",
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"next_step_id": "scan"}
+        )
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "scan"
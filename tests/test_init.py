@@ -0,0 +1,203 @@
+"""Test reload and shutdown of SamsungTV Smart entries."""
+import asyncio
+import gc
+import json
+import os
+import threading
+from unittest.mock import patch
+
+from aiohttp import web
+import async_timeout
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PORT,
+    EVENT_HOMEASSISTANT_STOP,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from .const import mock_entry_data
+from custom_components.samsungtv_smart.const import (
+    CONF_EXT_POWER_ENTITY,
+    DATA_MEDIA_PLAYER,
+    DOMAIN,
+)
+
+LOCAL_HOST = "127.0.0.1"
+NUM_RELOADS = 5
+CONNECT_TIMEOUT = 5
+EXT_POWER_ENTITY = "binary_sensor.tv_power"
+
+
+@pytest.fixture(name="tv_server")
+async def tv_server_fixture(socket_enabled):
+    """Run a local websocket server that accept connections as a TV."""
+    connections = set()
+
+    async def handle_ws(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        connections.add(ws)
+        await ws.send_str(
+            json.dumps(
+                {
+                    "event": "ms.channel.connect",
+                    "data": {
+                        "id": "mock-client",
+                        "clients": [
+                            {
+                                "id": "mock-client",
+                                "deviceName": request.query.get("name"),
+                            }
+                        ],
+                    },
+                }
+            )
+        )
+        async for _ in ws:
+            pass
+        connections.discard(ws)
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/api/v2/channels/samsung.remote.control", handle_ws)
+    app.router.add_get("/api/v2", handle_ws)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, LOCAL_HOST, 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield port
+    for ws in list(connections):
+        await ws.close()
+    await runner.cleanup()
+
+
+def _count_resources() -> tuple[int, int, int]:
+    """Return the number of threads, sockets and file descriptors in use."""
+    # selectors of terminated connections are released by garbage collection
+    gc.collect()
+    fds = []
+    for fd in os.listdir("/proc/self/fd"):
+        try:
+            fds.append(os.readlink(f"/proc/self/fd/{fd}"))
+        except OSError:
+            continue
+    sockets = [fd for fd in fds if fd.startswith("socket:")]
+    return threading.active_count(), len(sockets), len(fds)
+
+
+async def _async_connect_tv(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Open the remote connection to the TV and send a key through the queue."""
+    media_player = hass.data[DOMAIN][entry.entry_id][DATA_MEDIA_PLAYER]
+    samsung_ws = media_player._ws
+    await hass.async_add_executor_job(samsung_ws.start_client)
+    async with async_timeout.timeout(CONNECT_TIMEOUT):
+        while not samsung_ws.is_connected:
+            await asyncio.sleep(0.05)
+    assert await hass.async_add_executor_job(samsung_ws.send_key, "KEY_VOLUP")
+
+
+async def _async_reload_cycle(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Connect the TV and reload the entry."""
+    await _async_connect_tv(hass, entry)
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.skipif(
+    not os.path.isdir("/proc/self/fd"), reason="file descriptors not available"
+)
+async def test_reload_does_not_leak_resources(
+    hass: HomeAssistant, tv_server: int
+) -> None:
+    """Test that threads, sockets and file descriptors are released on reload."""
+    assert await async_setup_component(hass, DOMAIN, {})
+
+    entry_data = mock_entry_data()
+    entry_data.update({CONF_HOST: LOCAL_HOST, CONF_PORT: tv_server})
+    entry = MockConfigEntry(domain=DOMAIN, data=entry_data)
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.samsungtv_smart.media_player.SamsungTVDevice.async_update"
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        # first cycle start executor and shared resources that are not released
+        await _async_reload_cycle(hass, entry)
+        baseline = _count_resources()
+
+        for _ in range(NUM_RELOADS):
+            await _async_reload_cycle(hass, entry)
+        assert _count_resources() == baseline
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_shutdown_executed_once(hass: HomeAssistant) -> None:
+    """Test that shutdown on HA stop is not repeated when the entry is unloaded."""
+    assert await async_setup_component(hass, DOMAIN, {})
+
+    entry = MockConfigEntry(domain=DOMAIN, data=mock_entry_data())
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.samsungtv_smart.media_player.SamsungTVDevice.async_update"
+    ), patch(
+        "custom_components.samsungtv_smart.media_player.SamsungTVWS.shutdown",
+        return_value=[],
+    ) as mock_shutdown:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock_shutdown.call_count == 1
+
+
+async def test_ext_power_entity_option_change(hass: HomeAssistant) -> None:
+    """Test that a new external power entity is tracked without reload."""
+    assert await async_setup_component(hass, DOMAIN, {})
+
+    entry = MockConfigEntry(domain=DOMAIN, data=mock_entry_data())
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.samsungtv_smart.media_player.SamsungTVDevice.async_update"
+    ), patch(
+        "custom_components.samsungtv_smart.media_player.AdaptivePollRate.async_signal"
+    ) as mock_signal:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        hass.config_entries.async_update_entry(
+            entry, options={CONF_EXT_POWER_ENTITY: EXT_POWER_ENTITY}
+        )
+        await hass.async_block_till_done()
+        mock_signal.reset_mock()
+
+        hass.states.async_set(EXT_POWER_ENTITY, STATE_ON)
+        await hass.async_block_till_done()
+        assert mock_signal.call_count == 1
+
+        hass.config_entries.async_update_entry(entry, options={})
+        await hass.async_block_till_done()
+        mock_signal.reset_mock()
+
+        hass.states.async_set(EXT_POWER_ENTITY, STATE_OFF)
+        await hass.async_block_till_done()
+        assert not mock_signal.called
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
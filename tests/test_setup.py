@@ -0,0 +1,121 @@
+"""Test setup of SamsungTV Smart entries."""
+import asyncio
+from datetime import timedelta
+import logging
+import time
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from .const import mock_entry_data
+from custom_components.samsungtv_smart import media_player
+from custom_components.samsungtv_smart.const import DEFAULT_SCAN_INTERVAL, DOMAIN
+
+NUM_ENTRIES = 10
+UPDATE_DURATION = 0.5
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def _async_setup_entries(
+    hass: HomeAssistant, entries: list[MockConfigEntry]
+) -> float:
+    """Set up the entries together as done on HA startup, return the time spent."""
+    start = time.monotonic()
+    for entry in entries:
+        entry.add_to_hass(hass)
+    results = await asyncio.gather(
+        *[hass.config_entries.async_setup(entry.entry_id) for entry in entries]
+    )
+    await hass.async_block_till_done()
+    assert all(results)
+    return time.monotonic() - start
+
+
+async def test_setup_time_benchmark(hass: HomeAssistant) -> None:
+    """
+    Compare setup time of entries with the first update executed in background
+    and with the blocking first update used before.
+    """
+    assert await async_setup_component(hass, DOMAIN, {})
+
+    updates = []
+
+    async def slow_update(entity):
+        """Simulate an update with TV unreachable."""
+        updates.append(entity.entity_id)
+        await asyncio.sleep(UPDATE_DURATION)
+
+    executor_jobs = []
+    add_executor_job = hass.async_add_executor_job
+
+    def track_executor_job(target, *args):
+        """Track executor jobs started by the integration."""
+        if getattr(target, "__module__", "").startswith("custom_components"):
+            executor_jobs.append(getattr(target, "__qualname__", repr(target)))
+        return add_executor_job(target, *args)
+
+    setup_entry = media_player.async_setup_entry
+
+    async def setup_entry_blocking(hass, entry, async_add_entities):
+        """Set up the platform forcing the first update before adding entity."""
+
+        def add_entities(new_entities, update_before_add=False):
+            async_add_entities(new_entities, True)
+
+        await setup_entry(hass, entry, add_entities)
+
+    blocking_entries = [
+        MockConfigEntry(domain=DOMAIN, data=mock_entry_data(index))
+        for index in range(NUM_ENTRIES)
+    ]
+    entries = [
+        MockConfigEntry(domain=DOMAIN, data=mock_entry_data(NUM_ENTRIES + index))
+        for index in range(NUM_ENTRIES)
+    ]
+    with patch(
+        "custom_components.samsungtv_smart.media_player.SamsungTVDevice.async_update",
+        autospec=True,
+        side_effect=slow_update,
+    ):
+        with patch.object(media_player, "async_setup_entry", setup_entry_blocking):
+            blocking_time = await _async_setup_entries(hass, blocking_entries)
+        assert len(updates) == NUM_ENTRIES
+        for entry in blocking_entries:
+            await hass.config_entries.async_remove(entry.entry_id)
+        await hass.async_block_till_done()
+        updates.clear()
+
+        with patch.object(hass, "async_add_executor_job", track_executor_job):
+            setup_time = await _async_setup_entries(hass, entries)
+
+        _LOGGER.info(
+            "Setup of %s entries: %.3fs with blocking first update, %.3fs without",
+            NUM_ENTRIES,
+            blocking_time,
+            setup_time,
+        )
+        # a blocking first update take at least UPDATE_DURATION
+        assert blocking_time >= UPDATE_DURATION
+        assert setup_time < UPDATE_DURATION
+        assert not updates
+        assert not executor_jobs
+        assert len(hass.states.async_entity_ids("media_player")) == NUM_ENTRIES
+
+        # first polls are distributed in background across the scan interval
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_SCAN_INTERVAL * 2)
+        )
+        await hass.async_block_till_done()
+        assert len(set(updates)) == NUM_ENTRIES
+
+        for entry in entries:
+            assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()